@@ -11,7 +11,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN, PLATFORMS
-from .data import MeterLocationsData, PlantsData
+from .data import EntryRuntime, MeterLocationsData, OutletListeners, PlantsData
 
 LEGACY_ENTITY_SUFFIXES: dict[str, tuple[str, ...]] = {
     "sensor": (
@@ -39,15 +39,6 @@ def _cleanup_legacy_entities(
             if entity_id:
                 entity_registry.async_remove(entity_id)
 
-    # Remove old switch-based auto watering controls (they've been replaced with valve platform)
-    for entry in list(entity_registry.entities.values()):
-        if entry.platform != DOMAIN:
-            continue
-        if entry.entity_id.startswith("switch.") and entry.unique_id.endswith(
-            "_water_power"
-        ):
-            entity_registry.async_remove(entry.entity_id)
-
     # Remove any valve entities (we migrated back to switch platform)
     for unique_id_suffix in ("water_power", "auto_watering_control"):
         unique_id = f"plant_{plant_id}_{unique_id_suffix}"
@@ -73,45 +64,58 @@ def _cleanup_legacy_entities(
         if entity:
             entity_registry.async_remove(old_switch_entity_id)
 
-    # Remove old text entities with examples in entity_id
-    # These need to be recreated with clean entity_ids
+    # Remove old manual watering switch entities (migrated to event platform)
+    manual_watering_switch_id = f"plant_{plant_id}_manual_watering"
+    old_manual_switch = entity_registry.async_get_entity_id(
+        "switch",
+        DOMAIN,
+        manual_watering_switch_id,
+    )
+    if old_manual_switch:
+        entity_registry.async_remove(old_manual_switch)
+
+
+def _cleanup_legacy_registry_entries(entity_registry: er.EntityRegistry) -> None:
+    # Patterns below are not plant specific, so walk the registry once per setup
+    # rather than once per plant.
     # Match old patterns like "text.watering_frequency_recommendation_e_g_once_a_week"
-    old_recommendation_patterns = [
+    old_recommendation_patterns = (
         "_recommendation_e_g_",  # Most recommendations
         "_todo_list_e_g_",       # Todo list
         "_other_recommendations_e_g_",  # Other recommendations
-    ]
-
-    for entry in list(entity_registry.entities.values()):
+    )
+    stale: list[str] = []
+    for entry in entity_registry.entities.values():
         if entry.platform != DOMAIN:
             continue
-        if not entry.entity_id.startswith("text."):
+        entity_id = entry.entity_id
+        unique_id = entry.unique_id or ""
+
+        # Remove old switch-based auto watering controls (they've been replaced with valve platform)
+        if entity_id.startswith("switch.") and unique_id.endswith("_water_power"):
+            stale.append(entity_id)
+            continue
+        if not entity_id.startswith("text."):
             continue
 
-        # Check if entity_id matches old patterns with examples
-        should_remove = any(pattern in entry.entity_id for pattern in old_recommendation_patterns)
+        # Remove old text entities with examples in entity_id
+        # These need to be recreated with clean entity_ids
+        should_remove = any(pattern in entity_id for pattern in old_recommendation_patterns)
 
         # Also check for the specific plant text entities by looking for the unique_id pattern
         # All plant text entities have unique_id like "plant_{uuid}_{field_key}"
-        if entry.unique_id and entry.unique_id.startswith("plant_") and "_recommendation" in entry.unique_id:
+        if unique_id.startswith("plant_") and "_recommendation" in unique_id:
             # This is a plant recommendation entity, remove it to recreate with clean entity_id
             should_remove = True
-        elif entry.unique_id and entry.unique_id.startswith("plant_") and ("todo_list" in entry.unique_id or "other_recommendations" in entry.unique_id):
+        elif unique_id.startswith("plant_") and ("todo_list" in unique_id or "other_recommendations" in unique_id):
             # Also handle todo_list and other_recommendations
             should_remove = True
 
         if should_remove:
-            entity_registry.async_remove(entry.entity_id)
+            stale.append(entity_id)
 
-    # Remove old manual watering switch entities (migrated to event platform)
-    manual_watering_switch_id = f"plant_{plant_id}_manual_watering"
-    old_manual_switch = entity_registry.async_get_entity_id(
-        "switch",
-        DOMAIN,
-        manual_watering_switch_id,
-    )
-    if old_manual_switch:
-        entity_registry.async_remove(old_manual_switch)
+    for entity_id in stale:
+        entity_registry.async_remove(entity_id)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -122,7 +126,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entity_registry = er.async_get(hass)
     if entry_type == "meter_locations":
         data = await MeterLocationsData.async_load(hass)
-        hass.data[DOMAIN][entry.entry_id] = {"type": entry_type, "data": data}
+        hass.data[DOMAIN][entry.entry_id] = EntryRuntime(entry_type, data)
         for location in data.meter_locations.values():
             device_registry.async_get_or_create(
                 config_entry_id=entry.entry_id,
@@ -133,7 +137,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
     else:
         data = await PlantsData.async_load(hass)
-        hass.data[DOMAIN][entry.entry_id] = {"type": entry_type, "data": data}
+        hass.data[DOMAIN][entry.entry_id] = EntryRuntime(
+            entry_type, data, outlets=OutletListeners(hass)
+        )
+        _cleanup_legacy_registry_entries(entity_registry)
         for plant in data.plants.values():
             device_registry.async_get_or_create(
                 config_entry_id=entry.entry_id,
@@ -226,7 +233,7 @@ async def _handle_add_plant(
     entry: ConfigEntry,
     call,
 ) -> None:
-    data: PlantsData = hass.data[DOMAIN][entry.entry_id]["data"]
+    data: PlantsData = hass.data[DOMAIN][entry.entry_id].data
     data.add_plant(
         name=call.data["name"],
         moisture_entity_id=call.data.get("moisture_entity_id"),
@@ -240,7 +247,7 @@ async def _handle_remove_plant(
     entry: ConfigEntry,
     call,
 ) -> None:
-    data: PlantsData = hass.data[DOMAIN][entry.entry_id]["data"]
+    data: PlantsData = hass.data[DOMAIN][entry.entry_id].data
     name = call.data["name"].strip().lower()
     plant_id = None
     for pid, plant in data.plants.items():
@@ -285,7 +292,8 @@ async def _handle_record_watering(
     call,
 ) -> None:
     """Handle recording a manual watering event."""
-    data: PlantsData = hass.data[DOMAIN][entry.entry_id]["data"]
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    data: PlantsData = runtime.data
     plant_name = call.data["plant"].strip().lower()
     plant_id = None
 
@@ -300,26 +308,7 @@ async def _handle_record_watering(
         return
 
     # Find the event entity
-    entity_registry = er.async_get(hass)
-    event_entity_id = entity_registry.async_get_entity_id(
-        "event",
-        DOMAIN,
-        f"plant_{plant_id}_manual_watering",
-    )
-
-    if not event_entity_id:
-        # Event entity not found
-        return
-
-    # Get the event entity and trigger the event
-    entity = None
-    for component in hass.data.get("entity_components", {}).values():
-        for candidate in getattr(component, "entities", []):
-            if getattr(candidate, "entity_id", None) == event_entity_id:
-                entity = candidate
-                break
-        if entity is not None:
-            break
+    entity = runtime.events.get(f"plant_{plant_id}_manual_watering")
 
     if entity and hasattr(entity, "record_watering"):
         entity.record_watering(
@@ -335,7 +324,8 @@ async def _handle_record_shower(
     call,
 ) -> None:
     """Handle recording a manual shower event."""
-    data: PlantsData = hass.data[DOMAIN][entry.entry_id]["data"]
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    data: PlantsData = runtime.data
     plant_name = call.data["plant"].strip().lower()
     plant_id = None
 
@@ -350,26 +340,7 @@ async def _handle_record_shower(
         return
 
     # Find the event entity
-    entity_registry = er.async_get(hass)
-    event_entity_id = entity_registry.async_get_entity_id(
-        "event",
-        DOMAIN,
-        f"plant_{plant_id}_manual_shower",
-    )
-
-    if not event_entity_id:
-        # Event entity not found
-        return
-
-    # Get the event entity and trigger the event
-    entity = None
-    for component in hass.data.get("entity_components", {}).values():
-        for candidate in getattr(component, "entities", []):
-            if getattr(candidate, "entity_id", None) == event_entity_id:
-                entity = candidate
-                break
-        if entity is not None:
-            break
+    entity = runtime.events.get(f"plant_{plant_id}_manual_shower")
 
     if entity and hasattr(entity, "record_shower"):
         entity.record_shower(
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
+from homeassistant.components.event import EventEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
-from .data import PlantsData
+from .data import EntryRuntime, PlantsData
 
 
 async def async_setup_entry(
@@ -18,14 +17,15 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Plants button entities from a config entry."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    if entry_data["type"] == "meter_locations":
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    if runtime.entry_type == "meter_locations":
         return
-    data: PlantsData = entry_data["data"]
-    entities = []
-    for plant_id in data.plants:
-        entities.append(PlantManualWateringButton(hass, data, plant_id))
-        entities.append(PlantManualShowerButton(hass, data, plant_id))
+    data: PlantsData = runtime.data
+    entities = [
+        entity_cls(hass, data, plant_id, runtime.events)
+        for plant_id in data.plants
+        for entity_cls in PLANT_BUTTON_CLASSES
+    ]
     if entities:
         async_add_entities(entities)
 
@@ -40,42 +40,20 @@ class PlantManualWateringButton(ButtonEntity):
         hass: HomeAssistant,
         data: PlantsData,
         plant_id: str,
+        events: dict[str, EventEntity],
     ) -> None:
         """Initialize the button entity."""
         self.hass = hass
         self._data = data
         self._plant_id = plant_id
-        plant = data.plants[plant_id]
-
+        self._events = events
         self._attr_name = "Add Manual Watering"
         self._attr_unique_id = f"plant_{plant_id}_manual_watering_button"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
 
     async def async_press(self) -> None:
         """Record a manual watering event."""
-        entity_registry = er.async_get(self.hass)
-        event_entity_id = entity_registry.async_get_entity_id(
-            "event",
-            DOMAIN,
-            f"plant_{self._plant_id}_manual_watering",
-        )
-        if not event_entity_id:
-            return
-
-        entity = None
-        for component in self.hass.data.get("entity_components", {}).values():
-            for candidate in getattr(component, "entities", []):
-                if getattr(candidate, "entity_id", None) == event_entity_id:
-                    entity = candidate
-                    break
-            if entity is not None:
-                break
-
+        entity = self._events.get(f"plant_{self._plant_id}_manual_watering")
         if entity and hasattr(entity, "record_watering"):
             entity.record_watering()
 
@@ -90,41 +68,25 @@ class PlantManualShowerButton(ButtonEntity):
         hass: HomeAssistant,
         data: PlantsData,
         plant_id: str,
+        events: dict[str, EventEntity],
     ) -> None:
         """Initialize the button entity."""
         self.hass = hass
         self._data = data
         self._plant_id = plant_id
-        plant = data.plants[plant_id]
-
+        self._events = events
         self._attr_name = "Add Manual Shower"
         self._attr_unique_id = f"plant_{plant_id}_manual_shower_button"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
 
     async def async_press(self) -> None:
         """Record a manual shower event."""
-        entity_registry = er.async_get(self.hass)
-        event_entity_id = entity_registry.async_get_entity_id(
-            "event",
-            DOMAIN,
-            f"plant_{self._plant_id}_manual_shower",
-        )
-        if not event_entity_id:
-            return
-
-        entity = None
-        for component in self.hass.data.get("entity_components", {}).values():
-            for candidate in getattr(component, "entities", []):
-                if getattr(candidate, "entity_id", None) == event_entity_id:
-                    entity = candidate
-                    break
-            if entity is not None:
-                break
-
+        entity = self._events.get(f"plant_{self._plant_id}_manual_shower")
         if entity and hasattr(entity, "record_shower"):
             entity.record_shower()
+
+
+PLANT_BUTTON_CLASSES: tuple[type[ButtonEntity], ...] = (
+    PlantManualWateringButton,
+    PlantManualShowerButton,
+)
@@ -69,9 +69,9 @@ class PlantsOptionsFlow(config_entries.OptionsFlow):
     async def async_step_add_plant(self, user_input=None):
         """Add a plant device."""
         if user_input is not None:
-            data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id][
-                "data"
-            ]
+            data: PlantsData = self.hass.data[DOMAIN][
+                self.config_entry.entry_id
+            ].data
             data.add_plant(
                 name=user_input["name"],
                 moisture_entity_id=user_input.get("moisture_entity_id"),
@@ -92,7 +92,7 @@ class PlantsOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_remove_plant(self, user_input=None):
         """Remove a plant device."""
-        data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id]["data"]
+        data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id].data
         plant_labels, plant_label_to_id = self._plant_label_maps(data)
 
         if user_input is not None:
@@ -114,7 +114,7 @@ class PlantsOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_set_moisture_entity(self, user_input=None):
         """Set plant moisture entity."""
-        data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id]["data"]
+        data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id].data
         plant_labels, plant_label_to_id = self._plant_label_maps(data)
 
         if user_input is not None:
@@ -140,7 +140,7 @@ class PlantsOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_set_light_entity(self, user_input=None):
         """Set plant light entity."""
-        data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id]["data"]
+        data: PlantsData = self.hass.data[DOMAIN][self.config_entry.entry_id].data
         plant_labels, plant_label_to_id = self._plant_label_maps(data)
 
         if user_input is not None:
@@ -200,7 +200,7 @@ class MeterLocationsOptionsFlow(config_entries.OptionsFlow):
                 )
             data: MeterLocationsData = self.hass.data[DOMAIN][
                 self.config_entry.entry_id
-            ]["data"]
+            ].data
             data.add_meter_location(
                 name=user_input["name"],
                 air_temperature_entity_id=air_temperature,
@@ -219,9 +219,9 @@ class MeterLocationsOptionsFlow(config_entries.OptionsFlow):
 
     async def async_step_remove_meter_location(self, user_input=None):
         """Remove a meter location device."""
-        data: MeterLocationsData = self.hass.data[DOMAIN][self.config_entry.entry_id][
-            "data"
-        ]
+        data: MeterLocationsData = self.hass.data[DOMAIN][
+            self.config_entry.entry_id
+        ].data
         labels, label_to_id = self._meter_location_label_maps(data)
 
         if user_input is not None:
@@ -12,6 +12,8 @@ PLATFORMS: list[Platform] = [
     Platform.EVENT,
 ]
 STORAGE_VERSION = 1
+SAVE_DELAY = 1.0
+SIGNAL_SOURCE_UPDATED = f"{DOMAIN}_source_updated"
 DEFAULT_SOIL_MOISTURE = 50.0
 DEFAULT_LOCATION_X = 0.0
 DEFAULT_LOCATION_Y = 0.0
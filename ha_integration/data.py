@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 from uuid import uuid4
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, STORAGE_VERSION
+from .const import DOMAIN, SAVE_DELAY, STORAGE_VERSION
 
 DEFAULT_PLANTS = ["Rose", "Tulip", "Aloe", "Basil"]
 
@@ -39,6 +42,9 @@ class PlantsData:
 
     store: Store
     plants: dict[str, Plant]
+    _device_infos: dict[str, DeviceInfo] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     @classmethod
     async def async_load(cls, hass: HomeAssistant) -> "PlantsData":
@@ -103,7 +109,15 @@ class PlantsData:
 
     async def async_save(self) -> None:
         """Persist plants."""
-        payload = {
+        await self.store.async_save(self._data_to_save())
+
+    @callback
+    def async_delay_save(self) -> None:
+        """Persist plants after SAVE_DELAY, coalescing repeated edits."""
+        self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {
             "plants": [
                 {
                     "id": plant.plant_id,
@@ -132,7 +146,18 @@ class PlantsData:
                 for plant in self.plants.values()
             ],
         }
-        await self.store.async_save(payload)
+
+    def device_info(self, plant_id: str) -> DeviceInfo:
+        """Return the DeviceInfo shared by all entities of a plant."""
+        device_info = self._device_infos.get(plant_id)
+        if device_info is None:
+            device_info = self._device_infos[plant_id] = DeviceInfo(
+                identifiers={(DOMAIN, f"plant_{plant_id}")},
+                name=self.plants[plant_id].name,
+                manufacturer="Custom",
+                model="Plant",
+            )
+        return device_info
 
     def add_plant(
         self,
@@ -218,6 +243,9 @@ class MeterLocationsData:
 
     store: Store
     meter_locations: dict[str, MeterLocation]
+    _device_infos: dict[str, DeviceInfo] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     @classmethod
     async def async_load(cls, hass: HomeAssistant) -> "MeterLocationsData":
@@ -246,7 +274,15 @@ class MeterLocationsData:
 
     async def async_save(self) -> None:
         """Persist meter locations."""
-        payload = {
+        await self.store.async_save(self._data_to_save())
+
+    @callback
+    def async_delay_save(self) -> None:
+        """Persist meter locations after SAVE_DELAY, coalescing repeated edits."""
+        self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {
             "meter_locations": [
                 {
                     "id": location.location_id,
@@ -259,7 +295,18 @@ class MeterLocationsData:
                 for location in self.meter_locations.values()
             ],
         }
-        await self.store.async_save(payload)
+
+    def device_info(self, location_id: str) -> DeviceInfo:
+        """Return the DeviceInfo shared by all entities of a meter location."""
+        device_info = self._device_infos.get(location_id)
+        if device_info is None:
+            device_info = self._device_infos[location_id] = DeviceInfo(
+                identifiers={(DOMAIN, f"meter_location_{location_id}")},
+                name=self.meter_locations[location_id].name,
+                manufacturer="Custom",
+                model="Meter Location",
+            )
+        return device_info
 
     def add_meter_location(
         self,
@@ -321,3 +368,56 @@ class MeterLocationsData:
         """Set meter location comments."""
         if location_id in self.meter_locations:
             self.meter_locations[location_id].comments = value
+
+
+class OutletListeners:
+    """Share one state change subscription per outlet between proxy entities."""
+
+    __slots__ = ("_hass", "_listeners", "_unsubs")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_register(
+        self, entity_id: str, listener: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call listener on state changes of entity_id until unregistered."""
+        listeners = self._listeners.setdefault(entity_id, [])
+        listeners.append(listener)
+        if entity_id not in self._unsubs:
+            self._unsubs[entity_id] = async_track_state_change_event(
+                self._hass, [entity_id], self._async_dispatch
+            )
+
+        @callback
+        def _unregister() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+            if listeners or self._listeners.get(entity_id) is not listeners:
+                return
+            del self._listeners[entity_id]
+            unsub = self._unsubs.pop(entity_id, None)
+            if unsub is not None:
+                unsub()
+
+        return _unregister
+
+    @callback
+    def _async_dispatch(self, event) -> None:
+        for listener in tuple(self._listeners.get(event.data["entity_id"], ())):
+            listener()
+
+
+@dataclass(slots=True)
+class EntryRuntime:
+    """Runtime data attached to a loaded config entry."""
+
+    entry_type: str
+    data: PlantsData | MeterLocationsData
+    groups: dict[str, Any] = field(default_factory=dict)
+    outlets: OutletListeners | None = None
+    # Event entities added for this entry, keyed by unique_id
+    events: dict[str, Any] = field(default_factory=dict)
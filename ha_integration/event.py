@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 from homeassistant.components.event import EventEntity, EventDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
-from .data import PlantsData
+from .data import EntryRuntime, PlantsData
 
 
 async def async_setup_entry(
@@ -20,39 +19,58 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Plants event entities from a config entry."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    if entry_data["type"] == "meter_locations":
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    if runtime.entry_type == "meter_locations":
         return
-    data: PlantsData = entry_data["data"]
-    entities = []
-    for plant_id in data.plants:
-        entities.append(PlantManualWateringEvent(data, plant_id))
-        entities.append(PlantManualShowerEvent(data, plant_id))
+    data: PlantsData = runtime.data
+    entities = [
+        entity_cls(data, plant_id, runtime.events)
+        for plant_id in data.plants
+        for entity_cls in PLANT_EVENT_CLASSES
+    ]
     if entities:
         async_add_entities(entities)
 
 
-class PlantManualWateringEvent(EventEntity):
-    """Event entity for manual plant watering tracking."""
+class PlantEventEntity(EventEntity):
+    """Event entity for a plant, reachable by unique_id while added."""
 
     _attr_has_entity_name = True
     _attr_device_class = EventDeviceClass.BUTTON
-    _attr_event_types = ["watered"]
 
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
+    _event_name: ClassVar[str]
+    _unique_id_suffix: ClassVar[str]
+
+    def __init__(
+        self, data: PlantsData, plant_id: str, events: dict[str, EventEntity]
+    ) -> None:
         """Initialize the event entity."""
         self._data = data
         self._plant_id = plant_id
-        plant = data.plants[plant_id]
+        self._events = events
+        self._attr_name = self._event_name
+        self._attr_unique_id = f"plant_{plant_id}_{self._unique_id_suffix}"
+        self._attr_device_info = data.device_info(plant_id)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Lets services and buttons find this entity without scanning components
+        self._events[self.unique_id] = self
+        self.async_on_remove(self._async_unregister)
 
-        self._attr_name = "Manual Watering"
-        self._attr_unique_id = f"plant_{plant_id}_manual_watering"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+    @callback
+    def _async_unregister(self) -> None:
+        if self._events.get(self.unique_id) is self:
+            del self._events[self.unique_id]
+
+
+class PlantManualWateringEvent(PlantEventEntity):
+    """Event entity for manual plant watering tracking."""
+
+    _attr_event_types = ["watered"]
+
+    _event_name = "Manual Watering"
+    _unique_id_suffix = "manual_watering"
 
     def record_watering(
         self,
@@ -77,27 +95,13 @@ class PlantManualWateringEvent(EventEntity):
         self.async_write_ha_state()
 
 
-class PlantManualShowerEvent(EventEntity):
+class PlantManualShowerEvent(PlantEventEntity):
     """Event entity for manual plant shower tracking."""
 
-    _attr_has_entity_name = True
-    _attr_device_class = EventDeviceClass.BUTTON
     _attr_event_types = ["showered"]
 
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        """Initialize the event entity."""
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-
-        self._attr_name = "Manual Shower"
-        self._attr_unique_id = f"plant_{plant_id}_manual_shower"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+    _event_name = "Manual Shower"
+    _unique_id_suffix = "manual_shower"
 
     def record_shower(
         self,
@@ -117,3 +121,9 @@ class PlantManualShowerEvent(EventEntity):
         self._attr_extra_state_attributes = {"event_data": event_data}
         self._trigger_event("showered", event_data)
         self.async_write_ha_state()
+
+
+PLANT_EVENT_CLASSES: tuple[type[PlantEventEntity], ...] = (
+    PlantManualWateringEvent,
+    PlantManualShowerEvent,
+)
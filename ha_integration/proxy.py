@@ -0,0 +1,160 @@
+"""Shared behaviour for entities proxying a plant's outlet device."""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import ClassVar
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .const import SIGNAL_SOURCE_UPDATED
+from .data import OutletListeners, PlantsData
+
+# Valve (open/opening) and switch (on) states that mean water is flowing
+WATER_ON_STATES = frozenset(("on", "open", "opening"))
+
+# Cached properties derived from the configured outlet entity id
+_OUTLET_CACHES = (
+    "_outlet_entity_id",
+    "_outlet_domain",
+    "_outlet_services",
+    "_service_data",
+)
+
+
+class PlantOutletProxy(Entity):
+    """Entity mirroring and controlling the outlet configured for a plant."""
+
+    __slots__ = (
+        "_data",
+        "_plant_id",
+        "_outlets",
+        "_unregister_outlet",
+        "_last_reported",
+    )
+
+    _attr_should_poll = False
+
+    # Plant attribute holding the outlet entity id
+    _outlet_attr: ClassVar[str]
+    # Outlet domains the proxy can drive; None accepts any domain
+    _outlet_domains: ClassVar[frozenset[str] | None] = None
+    # Outlet states reported as on/open
+    _on_states: ClassVar[frozenset[str]] = frozenset((STATE_ON,))
+    _name_suffix: ClassVar[str]
+    _unique_id_suffix: ClassVar[str]
+
+    def __init__(
+        self, data: PlantsData, plant_id: str, outlets: OutletListeners
+    ) -> None:
+        self._data = data
+        self._plant_id = plant_id
+        self._outlets = outlets
+        self._unregister_outlet: CALLBACK_TYPE | None = None
+        self._last_reported: tuple[bool, str | None] | None = None
+        plant = data.plants[plant_id]
+        self._attr_name = f"{plant.name} {self._name_suffix}"
+        self._attr_unique_id = f"plant_{plant_id}_{self._unique_id_suffix}"
+        self._attr_device_info = data.device_info(plant_id)
+
+    @cached_property
+    def _outlet_entity_id(self) -> str | None:
+        return getattr(self._data.plants[self._plant_id], self._outlet_attr)
+
+    @cached_property
+    def _outlet_domain(self) -> str | None:
+        outlet = self._outlet_entity_id
+        return outlet.split(".", 1)[0] if outlet else None
+
+    @cached_property
+    def _outlet_services(self) -> tuple[str, str]:
+        if self._outlet_domain == "valve":
+            return ("open_valve", "close_valve")
+        return ("turn_on", "turn_off")
+
+    @cached_property
+    def _service_data(self) -> dict[str, str | None]:
+        return {"entity_id": self._outlet_entity_id}
+
+    def _outlet_is_on(self) -> bool | None:
+        """Return whether the outlet is on, or None if it has no state."""
+        hass = self.hass
+        outlet = self._outlet_entity_id
+        if not outlet or not hass:
+            return None
+        state = hass.states.get(outlet)
+        if state is None:
+            return None
+        return state.state in self._on_states
+
+    async def _async_call_outlet(self, turn_on: bool) -> None:
+        if not self._outlet_entity_id or not self.hass:
+            return
+        domain = self._outlet_domain
+        domains = self._outlet_domains
+        if domains is not None and domain not in domains:
+            return
+        services = self._outlet_services
+        await self.hass.services.async_call(
+            domain, services[0] if turn_on else services[1], self._service_data
+        )
+
+    @callback
+    def _async_source_updated(self) -> None:
+        for key in _OUTLET_CACHES:
+            self.__dict__.pop(key, None)
+        self._last_reported = None
+        self._async_track_outlet()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_available(self) -> None:
+        outlet = self._outlet_entity_id
+        domains = self._outlet_domains
+        # Available while the outlet exists, even if it is temporarily unavailable
+        self._attr_available = bool(
+            outlet
+            and outlet != "None"
+            and (domains is None or self._outlet_domain in domains)
+            and self.hass.states.get(outlet) is not None
+        )
+
+    @callback
+    def _async_outlet_changed(self) -> None:
+        self._update_available()
+        # Outlets such as smart plugs report attribute-only updates often
+        reported = (self._attr_available, self.state)
+        if reported == self._last_reported:
+            return
+        self._last_reported = reported
+        self.async_write_ha_state()
+
+    @callback
+    def _async_untrack_outlet(self) -> None:
+        if self._unregister_outlet is not None:
+            self._unregister_outlet()
+            self._unregister_outlet = None
+
+    @callback
+    def _async_track_outlet(self) -> None:
+        self._async_untrack_outlet()
+        entity_id = self._outlet_entity_id
+        if entity_id:
+            self._unregister_outlet = self._outlets.async_register(
+                entity_id, self._async_outlet_changed
+            )
+        self._update_available()
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}",
+                self._async_source_updated,
+            )
+        )
+        self.async_on_remove(self._async_untrack_outlet)
+        self._async_track_outlet()
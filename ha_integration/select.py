@@ -5,20 +5,20 @@ from __future__ import annotations
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN
-from .data import MeterLocationsData, PlantsData
+from .const import DOMAIN, SIGNAL_SOURCE_UPDATED
+from .data import EntryRuntime, MeterLocationsData, PlantsData
 
 OPTION_NONE = "None"
-DEVICE_SOURCE_DOMAINS = ("switch",)
-AUTO_WATERING_SOURCE_DOMAINS = ("valve",)
-MOISTURE_DEVICE_DOMAINS = ("sensor", "number", "input_number")
-HUMIDIFIER_DEVICE_DOMAINS = ("switch", "input_boolean")
-HUMIDITY_DEVICE_DOMAINS = ("sensor", "number", "input_number")
-AIR_TEMPERATURE_DEVICE_DOMAINS = ("sensor", "number", "input_number")
+DEVICE_SOURCE_DOMAINS = frozenset(("switch",))
+AUTO_WATERING_SOURCE_DOMAINS = frozenset(("valve",))
+MOISTURE_DEVICE_DOMAINS = frozenset(("sensor", "number", "input_number"))
+HUMIDIFIER_DEVICE_DOMAINS = frozenset(("switch", "input_boolean"))
+HUMIDITY_DEVICE_DOMAINS = frozenset(("sensor", "number", "input_number"))
+AIR_TEMPERATURE_DEVICE_DOMAINS = frozenset(("sensor", "number", "input_number"))
 
 
 def _excluded_plants_entities(hass: HomeAssistant) -> set[str]:
@@ -56,22 +56,22 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Plants select entities from a config entry."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    entry_type = entry_data["type"]
-    data = entry_data["data"]
-    entities: list[SelectEntity] = []
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    entry_type = runtime.entry_type
+    data = runtime.data
+    entities: list[SelectEntity]
     if entry_type == "meter_locations":
-        for location_id in data.meter_locations:
-            entities.append(LocationAirHumiditySelect(data, location_id))
-            entities.append(LocationAirTemperatureSelect(data, location_id))
+        entities = [
+            entity_cls(data, location_id)
+            for location_id in data.meter_locations
+            for entity_cls in LOCATION_SELECT_CLASSES
+        ]
     else:
-        for plant_id in data.plants:
-            entities.append(PlantLightSelect(data, plant_id))
-            entities.append(PlantWaterSelect(data, plant_id))
-            entities.append(PlantMoistureSelect(data, plant_id))
-            entities.append(PlantHumiditySelect(data, plant_id))
-            entities.append(PlantAirTemperatureSelect(data, plant_id))
-            entities.append(PlantHumidifierSelect(data, plant_id))
+        entities = [
+            entity_cls(data, plant_id)
+            for plant_id in data.plants
+            for entity_cls in PLANT_SELECT_CLASSES
+        ]
     if entities:
         async_add_entities(entities)
 
@@ -85,12 +85,7 @@ class PlantLightSelect(SelectEntity):
         plant = data.plants[plant_id]
         self._attr_name = f"{plant.name} Grow Light Device Source"
         self._attr_unique_id = f"plant_{plant_id}_light_outlet"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -116,7 +111,10 @@ class PlantLightSelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_plant_light(self._plant_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}"
+        )
         self.async_write_ha_state()
 
 
@@ -129,12 +127,7 @@ class PlantMoistureSelect(SelectEntity):
         plant = data.plants[plant_id]
         self._attr_name = f"{plant.name} Soil Moisture Device Source"
         self._attr_unique_id = f"plant_{plant_id}_moisture_source"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -160,7 +153,10 @@ class PlantMoistureSelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_plant_moisture(self._plant_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}"
+        )
         self.async_write_ha_state()
 
 
@@ -173,12 +169,7 @@ class PlantWaterSelect(SelectEntity):
         plant = data.plants[plant_id]
         self._attr_name = f"{plant.name} Auto Watering Device Source"
         self._attr_unique_id = f"plant_{plant_id}_water_outlet"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -203,7 +194,10 @@ class PlantWaterSelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_plant_water(self._plant_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}"
+        )
         self.async_write_ha_state()
 
 
@@ -216,12 +210,7 @@ class PlantHumiditySelect(SelectEntity):
         plant = data.plants[plant_id]
         self._attr_name = f"{plant.name} Air Humidity Meter Source"
         self._attr_unique_id = f"plant_{plant_id}_humidity_source"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -247,7 +236,10 @@ class PlantHumiditySelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_plant_humidity(self._plant_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}"
+        )
         self.async_write_ha_state()
 
 
@@ -260,12 +252,7 @@ class PlantHumidifierSelect(SelectEntity):
         plant = data.plants[plant_id]
         self._attr_name = f"{plant.name} Air Humidifier Device Source"
         self._attr_unique_id = f"plant_{plant_id}_humidifier_source"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -291,7 +278,10 @@ class PlantHumidifierSelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_plant_humidifier(self._plant_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}"
+        )
         self.async_write_ha_state()
 
 
@@ -304,12 +294,7 @@ class PlantAirTemperatureSelect(SelectEntity):
         plant = data.plants[plant_id]
         self._attr_name = f"{plant.name} Air Temperature Meter Source"
         self._attr_unique_id = f"plant_{plant_id}_air_temperature_source"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -335,7 +320,10 @@ class PlantAirTemperatureSelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_plant_air_temperature(self._plant_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_SOURCE_UPDATED}_plant_{self._plant_id}"
+        )
         self.async_write_ha_state()
 
 
@@ -348,12 +336,7 @@ class LocationAirHumiditySelect(SelectEntity):
         location = data.meter_locations[location_id]
         self._attr_name = f"{location.name} Air Humidity Meter Source"
         self._attr_unique_id = f"meter_location_{location_id}_air_humidity_source"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"meter_location_{location_id}")},
-            name=location.name,
-            manufacturer="Custom",
-            model="Meter Location",
-        )
+        self._attr_device_info = data.device_info(location_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -379,7 +362,11 @@ class LocationAirHumiditySelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_meter_location_air_humidity(self._location_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass,
+            f"{SIGNAL_SOURCE_UPDATED}_meter_location_{self._location_id}",
+        )
         self.async_write_ha_state()
 
 
@@ -392,12 +379,7 @@ class LocationAirTemperatureSelect(SelectEntity):
         location = data.meter_locations[location_id]
         self._attr_name = f"{location.name} Air Temperature Meter Source"
         self._attr_unique_id = f"meter_location_{location_id}_air_temperature_source"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"meter_location_{location_id}")},
-            name=location.name,
-            manufacturer="Custom",
-            model="Meter Location",
-        )
+        self._attr_device_info = data.device_info(location_id)
         self._attr_entity_category = EntityCategory.CONFIG
 
     @property
@@ -423,5 +405,23 @@ class LocationAirTemperatureSelect(SelectEntity):
     async def async_select_option(self, option: str) -> None:
         entity_id = None if option == OPTION_NONE else option
         self._data.set_meter_location_air_temperature(self._location_id, entity_id)
-        await self._data.async_save()
+        self._data.async_delay_save()
+        async_dispatcher_send(
+            self.hass,
+            f"{SIGNAL_SOURCE_UPDATED}_meter_location_{self._location_id}",
+        )
         self.async_write_ha_state()
+
+
+PLANT_SELECT_CLASSES: tuple[type[SelectEntity], ...] = (
+    PlantLightSelect,
+    PlantWaterSelect,
+    PlantMoistureSelect,
+    PlantHumiditySelect,
+    PlantAirTemperatureSelect,
+    PlantHumidifierSelect,
+)
+LOCATION_SELECT_CLASSES: tuple[type[SelectEntity], ...] = (
+    LocationAirHumiditySelect,
+    LocationAirTemperatureSelect,
+)
@@ -2,14 +2,161 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import DOMAIN
-from .data import MeterLocationsData, PlantsData
+from .const import DOMAIN, SIGNAL_SOURCE_UPDATED
+from .data import (
+    EntryRuntime,
+    MeterLocation,
+    MeterLocationsData,
+    Plant,
+    PlantsData,
+)
+
+_UNAVAILABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+
+@dataclass(frozen=True, slots=True)
+class SourceSensorDescription:
+    """Describe a sensor that mirrors a configured source entity.
+
+    Numeric sensors report the source value and unit and expose the source
+    entity id as an attribute; the others map the source state to a message.
+    """
+
+    key: str
+    name_suffix: str
+    source_attr: str
+    unavailable_msg: str
+    numeric: bool = True
+    state_messages: dict[str, str] | None = None
+
+
+PLANT_SENSOR_DESCRIPTIONS: tuple[SourceSensorDescription, ...] = (
+    SourceSensorDescription(
+        key="moisture",
+        name_suffix="Soil Moisture State",
+        source_attr="moisture_entity_id",
+        unavailable_msg="No soil moisture meter near the plant.",
+    ),
+    SourceSensorDescription(
+        key="humidity",
+        name_suffix="Air Humidity Meter",
+        source_attr="humidity_entity_id",
+        unavailable_msg="No air humidity meter near the plant.",
+    ),
+    SourceSensorDescription(
+        key="air_temperature",
+        name_suffix="Air Temperature Meter",
+        source_attr="air_temperature_entity_id",
+        unavailable_msg="No air temperature meter near the plant.",
+    ),
+    SourceSensorDescription(
+        key="light_state",
+        name_suffix="Grow Light State",
+        source_attr="light_entity_id",
+        unavailable_msg="No grow light near the plant.",
+        numeric=False,
+        state_messages={
+            "on": "Light is on",
+            "off": "Light is off",
+            "unavailable": "Light device unavailable",
+        },
+    ),
+    SourceSensorDescription(
+        key="auto_watering_state",
+        name_suffix="Auto Watering State",
+        source_attr="water_entity_id",
+        unavailable_msg=(
+            "Device not installed. Watering can only be done manually by the user."
+        ),
+        numeric=False,
+        state_messages={
+            # Support both valve (open/closed) and switch (on/off) states
+            "on": "Watering",
+            "open": "Watering",
+            "opening": "Watering",
+            "off": "Not watering",
+            "closed": "Not watering",
+            "closing": "Not watering",
+            "unavailable": "Device unavailable",
+        },
+    ),
+    SourceSensorDescription(
+        key="humidifier_state",
+        name_suffix="Air Humidifier State",
+        source_attr="humidifier_entity_id",
+        unavailable_msg="No air humidifier near the plant.",
+        numeric=False,
+        state_messages={
+            "on": "Humidifier is on",
+            "off": "Humidifier is off",
+            "unavailable": "Humidifier device unavailable",
+        },
+    ),
+)
+
+LOCATION_SENSOR_DESCRIPTIONS: tuple[SourceSensorDescription, ...] = (
+    SourceSensorDescription(
+        key="air_humidity",
+        name_suffix="Air Humidity Meter",
+        source_attr="air_humidity_entity_id",
+        unavailable_msg="No air humidity meter for this location.",
+    ),
+    SourceSensorDescription(
+        key="air_temperature",
+        name_suffix="Air Temperature Meter",
+        source_attr="air_temperature_entity_id",
+        unavailable_msg="No air temperature meter for this location.",
+    ),
+)
+
+
+def _build_location_sensors(
+    hass: HomeAssistant, runtime: EntryRuntime
+) -> list[SensorEntity]:
+    data: MeterLocationsData = runtime.data
+    entities: list[SensorEntity] = []
+    for location_id in data.meter_locations:
+        device_info = data.device_info(location_id)
+        for description in LOCATION_SENSOR_DESCRIPTIONS:
+            entities.append(
+                LocationSourceSensor(data, location_id, device_info, description)
+            )
+    return entities
+
+
+def _build_plant_sensors(
+    hass: HomeAssistant, runtime: EntryRuntime
+) -> list[SensorEntity]:
+    data: PlantsData = runtime.data
+    groups: dict[str, PlantSensorGroup] = runtime.groups
+    source_attrs = tuple(
+        description.source_attr for description in PLANT_SENSOR_DESCRIPTIONS
+    )
+    entities: list[SensorEntity] = []
+    for plant_id, plant in data.plants.items():
+        group = groups[plant_id] = PlantSensorGroup(hass, plant, source_attrs)
+        device_info = data.device_info(plant_id)
+        for description in PLANT_SENSOR_DESCRIPTIONS:
+            entities.append(
+                PlantSourceSensor(data, plant_id, group, device_info, description)
+            )
+    return entities
+
+
+_BUILDERS = {
+    "meter_locations": _build_location_sensors,
+    "plants": _build_plant_sensors,
+}
 
 
 async def async_setup_entry(
@@ -18,399 +165,221 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Plants sensors from a config entry."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    entry_type = entry_data["type"]
-    data = entry_data["data"]
-    entities: list[SensorEntity] = []
-    if entry_type == "meter_locations":
-        for location_id in data.meter_locations:
-            entities.append(LocationAirHumiditySensor(data, location_id))
-            entities.append(LocationAirTemperatureSensor(data, location_id))
-    else:
-        for plant_id in data.plants:
-            entities.append(PlantMoistureSensor(data, plant_id))
-            entities.append(PlantHumiditySensor(data, plant_id))
-            entities.append(PlantAirTemperatureSensor(data, plant_id))
-            entities.append(PlantLightStateSensor(data, plant_id))
-            entities.append(PlantAutoWateringStateSensor(data, plant_id))
-            entities.append(PlantHumidifierStateSensor(data, plant_id))
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    builder = _BUILDERS.get(runtime.entry_type, _build_plant_sensors)
+    entities = builder(hass, runtime)
     if entities:
         async_add_entities(entities)
 
 
-class PlantMoistureSensor(SensorEntity):
-    """Sensor mirroring the configured moisture state."""
-
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Soil Moisture State"
-        self._attr_unique_id = f"plant_{plant_id}_moisture"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
+class PlantSensorGroup:
+    """Single state change subscription shared by the sensors of one plant."""
+
+    __slots__ = (
+        "_hass",
+        "_plant",
+        "_source_attrs",
+        "_source_entity_ids",
+        "_sensors",
+        "_unsub",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        plant: Plant,
+        source_attrs: tuple[str, ...],
+    ) -> None:
+        self._hass = hass
+        self._plant = plant
+        self._source_attrs = source_attrs
+        self._source_entity_ids = self._current_source_entity_ids()
+        self._sensors: list[SourceSensor] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    def _current_source_entity_ids(self) -> list[str]:
+        plant = self._plant
+        return sorted(
+            {
+                entity_id
+                for attr in self._source_attrs
+                if (entity_id := getattr(plant, attr))
+            }
         )
 
-    @property
-    def native_value(self):
-        moisture_entity_id = self._data.plants[self._plant_id].moisture_entity_id
-        if not moisture_entity_id or not self.hass:
-            return "No soil moisture meter near the plant."
-        state = self.hass.states.get(moisture_entity_id)
-        if state is None or state.state in ("unknown", "unavailable"):
-            return "No soil moisture meter near the plant."
-        try:
-            return float(state.state)
-        except ValueError:
-            return state.state
-
-    @property
-    def native_unit_of_measurement(self):
-        moisture_entity_id = self._data.plants[self._plant_id].moisture_entity_id
-        if not moisture_entity_id or not self.hass:
-            return None
-        state = self.hass.states.get(moisture_entity_id)
-        if not state:
-            return None
-        return state.attributes.get("unit_of_measurement")
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        plant = self._data.plants[self._plant_id]
-        return {"moisture_entity_id": plant.moisture_entity_id}
-
-
-class PlantHumiditySensor(SensorEntity):
-    """Sensor mirroring the configured humidity meter state."""
-
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Air Humidity Meter"
-        self._attr_unique_id = f"plant_{plant_id}_humidity"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
-
-    @property
-    def native_value(self):
-        humidity_entity_id = self._data.plants[self._plant_id].humidity_entity_id
-        if not humidity_entity_id or not self.hass:
-            return "No air humidity meter near the plant."
-        state = self.hass.states.get(humidity_entity_id)
-        if state is None or state.state in ("unknown", "unavailable"):
-            return "No air humidity meter near the plant."
-        try:
-            return float(state.state)
-        except ValueError:
-            return state.state
-
-    @property
-    def native_unit_of_measurement(self):
-        humidity_entity_id = self._data.plants[self._plant_id].humidity_entity_id
-        if not humidity_entity_id or not self.hass:
-            return None
-        state = self.hass.states.get(humidity_entity_id)
-        if not state:
-            return None
-        return state.attributes.get("unit_of_measurement")
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        plant = self._data.plants[self._plant_id]
-        return {"humidity_entity_id": plant.humidity_entity_id}
-
-
-class PlantLightStateSensor(SensorEntity):
-    """Sensor describing the current light state."""
-
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Grow Light State"
-        self._attr_unique_id = f"plant_{plant_id}_light_state"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
-
-    @property
-    def native_value(self):
-        outlet_entity_id = self._data.plants[self._plant_id].light_entity_id
-        if not outlet_entity_id or not self.hass:
-            return "No grow light near the plant."
-        state = self.hass.states.get(outlet_entity_id)
-        if not state:
-            return "No grow light near the plant."
-        # Map states to human-readable messages
-        raw_state = state.state.lower()
-        if raw_state == "on":
-            return "Light is on"
-        elif raw_state == "off":
-            return "Light is off"
-        elif raw_state == "unavailable":
-            return "Light device unavailable"
-        else:
-            return raw_state
-
-    async def async_added_to_hass(self) -> None:
-        outlet_entity_id = self._data.plants[self._plant_id].light_entity_id
-        if not outlet_entity_id or not self.hass:
-            return
+    @callback
+    def async_register(self, sensor: SourceSensor) -> CALLBACK_TYPE:
+        """Route source state changes to sensor until unregistered."""
+        self._sensors.append(sensor)
+        self._async_subscribe()
 
         @callback
-        def _handle_state_change(event) -> None:
-            self.async_write_ha_state()
+        def _unregister() -> None:
+            if sensor in self._sensors:
+                self._sensors.remove(sensor)
+            if not self._sensors:
+                self._async_unsubscribe()
+
+        return _unregister
+
+    @callback
+    def async_refresh(self) -> None:
+        """Follow source entity changes made after setup."""
+        source_entity_ids = self._current_source_entity_ids()
+        if source_entity_ids == self._source_entity_ids:
+            return
+        self._source_entity_ids = source_entity_ids
+        self._async_unsubscribe()
+        if self._sensors:
+            self._async_subscribe()
+
+    @callback
+    def _async_subscribe(self) -> None:
+        if self._unsub is None and self._source_entity_ids:
+            self._unsub = async_track_state_change_event(
+                self._hass, self._source_entity_ids, self._async_dispatch
+            )
 
-        async_track_state_change_event(self.hass, [outlet_entity_id], _handle_state_change)
+    @callback
+    def _async_unsubscribe(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_dispatch(self, event) -> None:
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        for sensor in self._sensors:
+            if sensor._source_entity_id == entity_id:
+                sensor._update_from_state(new_state)
+
+
+class SourceSensor(SensorEntity):
+    """Sensor mirroring the state of a configured source entity."""
+
+    __slots__ = ("_owner", "_description", "_signal", "_source_entity_id")
+
+    def __init__(
+        self,
+        owner: Plant | MeterLocation,
+        description: SourceSensorDescription,
+        device_key: str,
+    ) -> None:
+        # The owner is edited in place, so it always holds the current source
+        self._owner = owner
+        self._description = description
+        self._signal = f"{SIGNAL_SOURCE_UPDATED}_{device_key}"
+        self._source_entity_id: str | None = None
+        self._refresh_source()
+
+    def _refresh_source(self) -> None:
+        description = self._description
+        self._source_entity_id = getattr(self._owner, description.source_attr)
+        if description.numeric:
+            self._attr_extra_state_attributes = {
+                description.source_attr: self._source_entity_id
+            }
 
+    async def async_added_to_hass(self) -> None:
+        await self.async_update()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._signal, self._async_source_updated
+            )
+        )
 
-class PlantAutoWateringStateSensor(SensorEntity):
-    """Sensor describing the automatic watering state."""
+    async def async_update(self) -> None:
+        entity_id = self._source_entity_id
+        self._set_from_state(self.hass.states.get(entity_id) if entity_id else None)
 
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Auto Watering State"
-        self._attr_unique_id = f"plant_{plant_id}_auto_watering_state"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
+    @callback
+    def _async_source_updated(self) -> None:
+        self._refresh_source()
+        entity_id = self._source_entity_id
+        self._update_from_state(
+            self.hass.states.get(entity_id) if entity_id else None
         )
 
-    @property
-    def native_value(self):
-        outlet_entity_id = self._data.plants[self._plant_id].water_entity_id
-        if not outlet_entity_id or not self.hass:
-            return (
-                "Device not installed. Watering can only be done manually by the user."
-            )
-        state = self.hass.states.get(outlet_entity_id)
-        if not state:
-            return (
-                "Device not installed. Watering can only be done manually by the user."
-            )
-        # Map valve/switch states to human-readable messages
-        raw_state = state.state.lower()
-        if raw_state in ("on", "open", "opening"):
-            return "Watering"
-        elif raw_state in ("off", "closed", "closing"):
-            return "Not watering"
-        elif raw_state == "unavailable":
-            return "Device unavailable"
+    def _set_from_state(self, state) -> None:
+        # Copy scalars out of the State; keeping it would pin its Context.
+        if state is None:
+            value = unit = None
         else:
-            return raw_state
-
-    async def async_added_to_hass(self) -> None:
-        outlet_entity_id = self._data.plants[self._plant_id].water_entity_id
-        if not outlet_entity_id or not self.hass:
+            value = state.state
+            unit = state.attributes.get("unit_of_measurement")
+        description = self._description
+        if not description.numeric:
+            if value is None:
+                self._attr_native_value = description.unavailable_msg
+                return
+            # Map states to human-readable messages
+            raw_state = value.lower()
+            self._attr_native_value = description.state_messages.get(
+                raw_state, raw_state
+            )
             return
+        self._attr_native_unit_of_measurement = unit
+        if value is None or value in _UNAVAILABLE_STATES:
+            self._attr_native_value = description.unavailable_msg
+            return
+        try:
+            self._attr_native_value = float(value)
+        except ValueError:
+            self._attr_native_value = value
 
-        @callback
-        def _handle_state_change(event) -> None:
-            self.async_write_ha_state()
+    @callback
+    def _update_from_state(self, state) -> None:
+        self._set_from_state(state)
+        self.async_write_ha_state()
 
-        async_track_state_change_event(self.hass, [outlet_entity_id], _handle_state_change)
 
+class PlantSourceSensor(SourceSensor):
+    """Plant sensor driven by a SourceSensorDescription."""
 
-class PlantHumidifierStateSensor(SensorEntity):
-    """Sensor describing the humidifier state."""
+    __slots__ = ("_group",)
 
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Air Humidifier State"
-        self._attr_unique_id = f"plant_{plant_id}_humidifier_state"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+    _attr_should_poll = False
 
-    @property
-    def native_value(self):
-        humidifier_entity_id = self._data.plants[self._plant_id].humidifier_entity_id
-        if not humidifier_entity_id or not self.hass:
-            return "No air humidifier near the plant."
-        state = self.hass.states.get(humidifier_entity_id)
-        if not state:
-            return "No air humidifier near the plant."
-        # Map states to human-readable messages
-        raw_state = state.state.lower()
-        if raw_state == "on":
-            return "Humidifier is on"
-        elif raw_state == "off":
-            return "Humidifier is off"
-        elif raw_state == "unavailable":
-            return "Humidifier device unavailable"
-        else:
-            return raw_state
+    def __init__(
+        self,
+        data: PlantsData,
+        plant_id: str,
+        group: PlantSensorGroup,
+        device_info: DeviceInfo,
+        description: SourceSensorDescription,
+    ) -> None:
+        self._group = group
+        plant = data.plants[plant_id]
+        super().__init__(plant, description, f"plant_{plant_id}")
+        self._attr_name = f"{plant.name} {description.name_suffix}"
+        self._attr_unique_id = f"plant_{plant_id}_{description.key}"
+        self._attr_device_info = device_info
 
     async def async_added_to_hass(self) -> None:
-        humidifier_entity_id = self._data.plants[self._plant_id].humidifier_entity_id
-        if not humidifier_entity_id or not self.hass:
-            return
+        await super().async_added_to_hass()
+        self.async_on_remove(self._group.async_register(self))
 
-        @callback
-        def _handle_state_change(event) -> None:
-            self.async_write_ha_state()
-
-        async_track_state_change_event(self.hass, [humidifier_entity_id], _handle_state_change)
+    @callback
+    def _async_source_updated(self) -> None:
+        self._group.async_refresh()
+        super()._async_source_updated()
 
 
-class PlantAirTemperatureSensor(SensorEntity):
-    """Sensor mirroring the configured air temperature meter state."""
+class LocationSourceSensor(SourceSensor):
+    """Meter location sensor driven by a SourceSensorDescription."""
 
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Air Temperature Meter"
-        self._attr_unique_id = f"plant_{plant_id}_air_temperature"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+    __slots__ = ()
 
-    @property
-    def native_value(self):
-        entity_id = self._data.plants[self._plant_id].air_temperature_entity_id
-        if not entity_id or not self.hass:
-            return "No air temperature meter near the plant."
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state in ("unknown", "unavailable"):
-            return "No air temperature meter near the plant."
-        try:
-            return float(state.state)
-        except ValueError:
-            return state.state
-
-    @property
-    def native_unit_of_measurement(self):
-        entity_id = self._data.plants[self._plant_id].air_temperature_entity_id
-        if not entity_id or not self.hass:
-            return None
-        state = self.hass.states.get(entity_id)
-        if not state:
-            return None
-        return state.attributes.get("unit_of_measurement")
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        plant = self._data.plants[self._plant_id]
-        return {"air_temperature_entity_id": plant.air_temperature_entity_id}
-
-
-class LocationAirHumiditySensor(SensorEntity):
-    """Sensor mirroring the configured air humidity meter for a location."""
-
-    def __init__(self, data: MeterLocationsData, location_id: str) -> None:
-        self._data = data
-        self._location_id = location_id
+    def __init__(
+        self,
+        data: MeterLocationsData,
+        location_id: str,
+        device_info: DeviceInfo,
+        description: SourceSensorDescription,
+    ) -> None:
         location = data.meter_locations[location_id]
-        self._attr_name = f"{location.name} Air Humidity Meter"
-        self._attr_unique_id = f"meter_location_{location_id}_air_humidity"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"meter_location_{location_id}")},
-            name=location.name,
-            manufacturer="Custom",
-            model="Meter Location",
-        )
-
-    @property
-    def native_value(self):
-        entity_id = self._data.meter_locations[
-            self._location_id
-        ].air_humidity_entity_id
-        if not entity_id or not self.hass:
-            return "No air humidity meter for this location."
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state in ("unknown", "unavailable"):
-            return "No air humidity meter for this location."
-        try:
-            return float(state.state)
-        except ValueError:
-            return state.state
-
-    @property
-    def native_unit_of_measurement(self):
-        entity_id = self._data.meter_locations[
-            self._location_id
-        ].air_humidity_entity_id
-        if not entity_id or not self.hass:
-            return None
-        state = self.hass.states.get(entity_id)
-        if not state:
-            return None
-        return state.attributes.get("unit_of_measurement")
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        location = self._data.meter_locations[self._location_id]
-        return {"air_humidity_entity_id": location.air_humidity_entity_id}
-
-
-class LocationAirTemperatureSensor(SensorEntity):
-    """Sensor mirroring the configured air temperature meter for a location."""
-
-    def __init__(self, data: MeterLocationsData, location_id: str) -> None:
-        self._data = data
-        self._location_id = location_id
-        location = data.meter_locations[location_id]
-        self._attr_name = f"{location.name} Air Temperature Meter"
-        self._attr_unique_id = f"meter_location_{location_id}_air_temperature"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"meter_location_{location_id}")},
-            name=location.name,
-            manufacturer="Custom",
-            model="Meter Location",
-        )
-
-    @property
-    def native_value(self):
-        entity_id = self._data.meter_locations[
-            self._location_id
-        ].air_temperature_entity_id
-        if not entity_id or not self.hass:
-            return "No air temperature meter for this location."
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state in ("unknown", "unavailable"):
-            return "No air temperature meter for this location."
-        try:
-            return float(state.state)
-        except ValueError:
-            return state.state
-
-    @property
-    def native_unit_of_measurement(self):
-        entity_id = self._data.meter_locations[
-            self._location_id
-        ].air_temperature_entity_id
-        if not entity_id or not self.hass:
-            return None
-        state = self.hass.states.get(entity_id)
-        if not state:
-            return None
-        return state.attributes.get("unit_of_measurement")
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        location = self._data.meter_locations[self._location_id]
-        return {"air_temperature_entity_id": location.air_temperature_entity_id}
+        super().__init__(location, description, f"meter_location_{location_id}")
+        self._attr_name = f"{location.name} {description.name_suffix}"
+        self._attr_unique_id = f"meter_location_{location_id}_{description.key}"
+        self._attr_device_info = device_info
@@ -4,12 +4,10 @@ from __future__ import annotations
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import HomeAssistant
 from .const import DOMAIN
-from .data import PlantsData
+from .data import EntryRuntime, PlantsData
+from .proxy import WATER_ON_STATES, PlantOutletProxy
 
 
 async def async_setup_entry(
@@ -18,231 +16,75 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Plants switch entities from a config entry."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    if entry_data["type"] == "meter_locations":
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    if runtime.entry_type == "meter_locations":
         return
-    data: PlantsData = entry_data["data"]
-    entities = []
-    for plant_id in data.plants:
-        entities.append(PlantLightSwitch(data, plant_id))
-        entities.append(PlantHumidifierSwitch(data, plant_id))
-        entities.append(PlantWaterSwitch(data, plant_id))
+    data: PlantsData = runtime.data
+    outlets = runtime.outlets
+    entities = [
+        entity_cls(data, plant_id, outlets)
+        for plant_id in data.plants
+        for entity_cls in PLANT_SWITCH_CLASSES
+    ]
     if entities:
         async_add_entities(entities)
 
-CONTROL_DOMAINS = ("switch", "light", "input_boolean")
-WATER_CONTROL_DOMAINS = ("valve", "switch")
-HUMIDIFIER_CONTROL_DOMAINS = ("switch", "input_boolean")
+CONTROL_DOMAINS = frozenset(("switch", "light", "input_boolean"))
+WATER_CONTROL_DOMAINS = frozenset(("valve", "switch"))
+HUMIDIFIER_CONTROL_DOMAINS = frozenset(("switch", "input_boolean"))
 
 
-class PlantLightSwitch(SwitchEntity):
-    """Proxy switch for a plant light outlet."""
-
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Grow Light Control"
-        self._attr_unique_id = f"plant_{plant_id}_light_power"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+class PlantOutletSwitch(PlantOutletProxy, SwitchEntity):
+    """Proxy switch for a plant outlet."""
 
-    @property
-    def _outlet_entity_id(self) -> str | None:
-        return self._data.plants[self._plant_id].light_entity_id
-
-    @property
-    def available(self) -> bool:
-        outlet = self._outlet_entity_id
-        return bool(outlet and self.hass.states.get(outlet))
+    __slots__ = ()
 
     @property
     def is_on(self) -> bool:
-        outlet = self._outlet_entity_id
-        if not outlet:
-            return False
-        state = self.hass.states.get(outlet)
-        if state is None:
-            return False
-        return state.state == STATE_ON
+        return bool(self._outlet_is_on())
 
     async def async_turn_on(self, **kwargs) -> None:
-        outlet = self._outlet_entity_id
-        if not outlet:
-            return
-        domain = outlet.split(".")[0]
-        await self.hass.services.async_call(
-            domain, "turn_on", {"entity_id": outlet}, blocking=True
-        )
+        await self._async_call_outlet(True)
 
     async def async_turn_off(self, **kwargs) -> None:
-        outlet = self._outlet_entity_id
-        if not outlet:
-            return
-        domain = outlet.split(".")[0]
-        await self.hass.services.async_call(
-            domain, "turn_off", {"entity_id": outlet}, blocking=True
-        )
-
-    async def async_added_to_hass(self) -> None:
-        outlet = self._outlet_entity_id
-        if not outlet:
-            return
-
-        @callback
-        def _handle_state_change(event) -> None:
-            self.async_write_ha_state()
+        await self._async_call_outlet(False)
 
-        async_track_state_change_event(self.hass, [outlet], _handle_state_change)
 
+class PlantLightSwitch(PlantOutletSwitch):
+    """Proxy switch for a plant light outlet."""
 
-class PlantWaterSwitch(SwitchEntity):
-    """Proxy switch for a plant water outlet (valve or switch)."""
-
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Auto Watering Control"
-        self._attr_unique_id = f"plant_{plant_id}_auto_watering_control"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
-
-    @property
-    def _outlet_entity_id(self) -> str | None:
-        return self._data.plants[self._plant_id].water_entity_id
-
-    @property
-    def available(self) -> bool:
-        outlet = self._outlet_entity_id
-        if not outlet or outlet == "None" or not self.hass:
-            return False
-        domain = outlet.split(".")[0]
-        if domain not in WATER_CONTROL_DOMAINS:
-            return False
-        state = self.hass.states.get(outlet)
-        return state is not None
-
-    @property
-    def is_on(self) -> bool:
-        outlet = self._outlet_entity_id
-        if not outlet or not self.hass:
-            return False
-        state = self.hass.states.get(outlet)
-        if state is None:
-            return False
-        # Support both valve (open/opening) and switch (on) states
-        return state.state in ("on", "open", "opening")
+    __slots__ = ()
 
-    async def async_turn_on(self, **kwargs) -> None:
-        outlet = self._outlet_entity_id
-        if not outlet or not self.hass:
-            return
-        domain = outlet.split(".")[0]
-        service = "open_valve" if domain == "valve" else "turn_on"
-        await self.hass.services.async_call(
-            domain, service, {"entity_id": outlet}, blocking=True
-        )
+    _outlet_attr = "light_entity_id"
+    _name_suffix = "Grow Light Control"
+    _unique_id_suffix = "light_power"
 
-    async def async_turn_off(self, **kwargs) -> None:
-        outlet = self._outlet_entity_id
-        if not outlet or not self.hass:
-            return
-        domain = outlet.split(".")[0]
-        service = "close_valve" if domain == "valve" else "turn_off"
-        await self.hass.services.async_call(
-            domain, service, {"entity_id": outlet}, blocking=True
-        )
 
-    async def async_added_to_hass(self) -> None:
-        outlet = self._outlet_entity_id
-        if not outlet or not self.hass:
-            return
+class PlantWaterSwitch(PlantOutletSwitch):
+    """Proxy switch for a plant water outlet (valve or switch)."""
 
-        @callback
-        def _handle_state_change(event) -> None:
-            self.async_write_ha_state()
+    __slots__ = ()
 
-        async_track_state_change_event(self.hass, [outlet], _handle_state_change)
+    _outlet_attr = "water_entity_id"
+    _outlet_domains = WATER_CONTROL_DOMAINS
+    _on_states = WATER_ON_STATES
+    _name_suffix = "Auto Watering Control"
+    _unique_id_suffix = "auto_watering_control"
 
 
-class PlantHumidifierSwitch(SwitchEntity):
+class PlantHumidifierSwitch(PlantOutletSwitch):
     """Proxy switch for a plant humidifier device."""
 
-    def __init__(self, data: PlantsData, plant_id: str) -> None:
-        self._data = data
-        self._plant_id = plant_id
-        plant = data.plants[plant_id]
-        self._attr_name = f"{plant.name} Air Humidifier Control"
-        self._attr_unique_id = f"plant_{plant_id}_humidifier_control"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
-
-    @property
-    def _control_entity_id(self) -> str | None:
-        return self._data.plants[self._plant_id].humidifier_entity_id
+    __slots__ = ()
 
-    @property
-    def available(self) -> bool:
-        entity_id = self._control_entity_id
-        if not entity_id or not self.hass:
-            return False
-        domain = entity_id.split(".")[0]
-        if domain not in HUMIDIFIER_CONTROL_DOMAINS:
-            return False
-        return bool(self.hass.states.get(entity_id))
+    _outlet_attr = "humidifier_entity_id"
+    _outlet_domains = HUMIDIFIER_CONTROL_DOMAINS
+    _name_suffix = "Air Humidifier Control"
+    _unique_id_suffix = "humidifier_control"
 
-    @property
-    def is_on(self) -> bool:
-        entity_id = self._control_entity_id
-        if not entity_id or not self.hass:
-            return False
-        state = self.hass.states.get(entity_id)
-        if state is None:
-            return False
-        return state.state == STATE_ON
 
-    async def async_turn_on(self, **kwargs) -> None:
-        entity_id = self._control_entity_id
-        if not entity_id or not self.hass:
-            return
-        domain = entity_id.split(".")[0]
-        if domain not in HUMIDIFIER_CONTROL_DOMAINS:
-            return
-        await self.hass.services.async_call(
-            domain, "turn_on", {"entity_id": entity_id}, blocking=True
-        )
-
-    async def async_turn_off(self, **kwargs) -> None:
-        entity_id = self._control_entity_id
-        if not entity_id or not self.hass:
-            return
-        domain = entity_id.split(".")[0]
-        if domain not in HUMIDIFIER_CONTROL_DOMAINS:
-            return
-        await self.hass.services.async_call(
-            domain, "turn_off", {"entity_id": entity_id}, blocking=True
-        )
-
-    async def async_added_to_hass(self) -> None:
-        entity_id = self._control_entity_id
-        if not entity_id or not self.hass:
-            return
-
-        @callback
-        def _handle_state_change(event) -> None:
-            self.async_write_ha_state()
-
-        async_track_state_change_event(self.hass, [entity_id], _handle_state_change)
+PLANT_SWITCH_CLASSES: tuple[type[SwitchEntity], ...] = (
+    PlantLightSwitch,
+    PlantHumidifierSwitch,
+    PlantWaterSwitch,
+)
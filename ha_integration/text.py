@@ -2,61 +2,87 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+from typing import NamedTuple
+
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
-from .data import MeterLocationsData, PlantsData
+from .data import EntryRuntime, MeterLocationsData, PlantsData
 
 MAX_RECOMMENDATION_LENGTH = 120
 
-# Format: (field_key, entity_name, friendly_name_with_example, max_length)
-FIELDS: list[tuple[str, str, str, int | None]] = [
-    (
+
+class FieldSpec(NamedTuple):
+    """Plant text field definition."""
+
+    key: str
+    entity_name: str
+    friendly_name: str
+    max_length: int | None
+
+    @property
+    def example(self) -> str | None:
+        """Return the example embedded in the friendly name, if any."""
+        if "(e.g., " not in self.friendly_name:
+            return None
+        return self.friendly_name.split("(e.g., ")[-1].rstrip(")")
+
+
+class LocationFieldSpec(NamedTuple):
+    """Meter location text field definition."""
+
+    key: str
+    label: str
+    max_length: int | None
+
+
+FIELDS: tuple[FieldSpec, ...] = (
+    FieldSpec(
         "watering_frequency_recommendation",
         "Watering Frequency Recommendation",
         "Watering Frequency Recommendation (e.g., once a week)",
         MAX_RECOMMENDATION_LENGTH,
     ),
-    (
+    FieldSpec(
         "soil_moisture_recommendation",
         "Minimum Soil Moisture Recommendation",
         "Minimum Soil Moisture for Watering Recommendation (e.g., 25%)",
         MAX_RECOMMENDATION_LENGTH,
     ),
-    (
+    FieldSpec(
         "air_temperature_recommendation",
         "Air Temperature Recommendation",
         "Air Temperature Recommendation (e.g., 20-24 C)",
         MAX_RECOMMENDATION_LENGTH,
     ),
-    (
+    FieldSpec(
         "air_humidity_recommendation",
         "Air Humidity Recommendation",
         "Air Humidity Recommendation (e.g., 50-60%)",
         MAX_RECOMMENDATION_LENGTH,
     ),
-    (
+    FieldSpec(
         "other_recommendations",
         "Other Recommendations",
         "Other Recommendations (e.g., - rotate weekly; - avoid drafts;)",
         None,
     ),
-    (
+    FieldSpec(
         "todo_list",
         "Todo List",
         "Todo List (e.g., - repot in spring; - prune dry leaves;)",
         None,
     ),
-]
+)
 
-LOCATION_FIELDS: list[tuple[str, str, int | None]] = [
-    ("description", "Location Description", None),
-    ("comments", "Location Comments", None),
-]
+LOCATION_FIELDS: tuple[LocationFieldSpec, ...] = (
+    LocationFieldSpec("description", "Location Description", None),
+    LocationFieldSpec("comments", "Location Comments", None),
+)
 
 
 async def async_setup_entry(
@@ -65,24 +91,22 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Plants text entities from a config entry."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    entry_type = entry_data["type"]
-    data = entry_data["data"]
-    entities: list[TextEntity] = []
+    runtime: EntryRuntime = hass.data[DOMAIN][entry.entry_id]
+    entry_type = runtime.entry_type
+    data = runtime.data
+    entities: list[TextEntity]
     if entry_type == "meter_locations":
-        for location_id in data.meter_locations:
-            for field_key, label, max_length in LOCATION_FIELDS:
-                entities.append(
-                    LocationNoteText(data, location_id, field_key, label, max_length)
-                )
+        entities = [
+            LocationNoteText(data, location_id, spec)
+            for location_id in data.meter_locations
+            for spec in LOCATION_FIELDS
+        ]
     else:
-        for plant_id in data.plants:
-            for field_key, entity_name, friendly_name, max_length in FIELDS:
-                entities.append(
-                    PlantRecommendationText(
-                        data, plant_id, field_key, entity_name, friendly_name, max_length
-                    )
-                )
+        entities = [
+            PlantRecommendationText(data, plant_id, spec)
+            for plant_id in data.plants
+            for spec in FIELDS
+        ]
     if entities:
         async_add_entities(entities)
 
@@ -90,86 +114,78 @@ async def async_setup_entry(
 class PlantRecommendationText(TextEntity):
     """Text entity for plant recommendations."""
 
+    __slots__ = ("_data", "_plant_id", "_field_key", "_get_value", "_plant")
+
     _attr_has_entity_name = True
 
     def __init__(
         self,
         data: PlantsData,
         plant_id: str,
-        field_key: str,
-        entity_name: str,
-        friendly_name: str,
-        max_length: int | None,
+        spec: FieldSpec,
     ) -> None:
         self._data = data
         self._plant_id = plant_id
-        self._field_key = field_key
-        plant = data.plants[plant_id]
+        self._field_key = spec.key
+        self._get_value = attrgetter(spec.key)
+        self._plant = data.plants[plant_id]
         # With has_entity_name=True:
         # - entity_id is generated from entity_name only (device name is prepended automatically)
         # - Use entity_name without examples for clean entity_id
-        self._attr_name = entity_name
+        self._attr_name = spec.entity_name
         # Store friendly_name with examples in extra attributes for reference
-        self._attr_extra_state_attributes = {
-            "example": friendly_name.split("(e.g., ")[-1].rstrip(")") if "(e.g., " in friendly_name else None
-        }
-        self._attr_unique_id = f"plant_{plant_id}_{field_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"plant_{plant_id}")},
-            name=plant.name,
-            manufacturer="Custom",
-            model="Plant",
-        )
+        self._attr_extra_state_attributes = {"example": spec.example}
+        self._attr_unique_id = f"plant_{plant_id}_{spec.key}"
+        self._attr_device_info = data.device_info(plant_id)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        if max_length is not None:
-            self._attr_native_max = max_length
+        if spec.max_length is not None:
+            self._attr_native_max = spec.max_length
 
     @property
     def native_value(self) -> str:
-        value = getattr(self._data.plants[self._plant_id], self._field_key)
-        return value or ""
+        return self._get_value(self._plant) or ""
 
     async def async_set_value(self, value: str) -> None:
-        setattr(self._data.plants[self._plant_id], self._field_key, value)
-        await self._data.async_save()
+        plant = self._plant
+        if self._get_value(plant) == value:
+            return
+        setattr(plant, self._field_key, value)
+        self._data.async_delay_save()
         self.async_write_ha_state()
 
 
 class LocationNoteText(TextEntity):
     """Text entity for meter location notes."""
 
+    __slots__ = ("_data", "_location_id", "_field_key", "_get_value", "_location")
+
     def __init__(
         self,
         data: MeterLocationsData,
         location_id: str,
-        field_key: str,
-        label: str,
-        max_length: int | None,
+        spec: LocationFieldSpec,
     ) -> None:
         self._data = data
         self._location_id = location_id
-        self._field_key = field_key
-        location = data.meter_locations[location_id]
-        self._attr_name = f"{location.name} {label}"
-        self._attr_unique_id = f"meter_location_{location_id}_{field_key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"meter_location_{location_id}")},
-            name=location.name,
-            manufacturer="Custom",
-            model="Meter Location",
-        )
+        self._field_key = spec.key
+        self._get_value = attrgetter(spec.key)
+        location = self._location = data.meter_locations[location_id]
+        self._attr_name = f"{location.name} {spec.label}"
+        self._attr_unique_id = f"meter_location_{location_id}_{spec.key}"
+        self._attr_device_info = data.device_info(location_id)
         self._attr_entity_category = EntityCategory.CONFIG
-        if max_length is not None:
-            self._attr_native_max = max_length
+        if spec.max_length is not None:
+            self._attr_native_max = spec.max_length
 
     @property
     def native_value(self) -> str:
-        value = getattr(self._data.meter_locations[self._location_id], self._field_key)
-        return value or ""
+        return self._get_value(self._location) or ""
 
     async def async_set_value(self, value: str) -> None:
-        location = self._data.meter_locations[self._location_id]
+        location = self._location
+        if self._get_value(location) == value:
+            return
         setattr(location, self._field_key, value)
-        await self._data.async_save()
+        self._data.async_delay_save()
         self.async_write_ha_state()
 
@@ -1,15 +1,37 @@
 """FastMCP entrypoint."""
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
 from plants_mcp.prompts import register_prompts
 from plants_mcp.resources import register_resources
 from plants_mcp.tools import register_tools
+from plants_mcp.tools.common import close_client, json_dumps, warm_up
 
 load_dotenv()
 
-mcp = FastMCP("My MCP Server")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    # Connect in the background so an unreachable Home Assistant never delays startup
+    warm_up_task = asyncio.create_task(warm_up())
+    try:
+        yield
+    finally:
+        warm_up_task.cancel()
+        await close_client()
+
+
+def tool_serializer(data: Any) -> str:
+    # Tool results are plain dicts; orjson encodes them much faster than the default
+    return json_dumps(data, default=str).decode()
+
+
+mcp = FastMCP("My MCP Server", lifespan=lifespan, tool_serializer=tool_serializer)
 register_tools(mcp)
 register_prompts(mcp)
 register_resources(mcp)
@@ -6,70 +6,78 @@ separate from operational plant-care actions.
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Any
-from zoneinfo import ZoneInfo
 
 from fastmcp import FastMCP
 
 from .common import (
+    LA_TZ,
     delay,
-    get_states_list,
+    get_plant_states_list,
     ha_request,
     history_window,
     match_plant_name,
+    parse_manual_buttons,
     parse_plants_from_states,
+    parse_timestamp,
 )
 
+# Sort key for history entries without a parseable timestamp
+_MIN_DT = datetime.min.replace(tzinfo=LA_TZ)
+# Marks a point bucket no history entry fell into
+_EMPTY = object()
+
+# Longest window get_plant_history serves
+MAX_HISTORY_DAYS = 90
+# Points x entities above which sensor history is fetched in day slices
+HISTORY_SHARD_THRESHOLD = 10_000
+HISTORY_SHARD_DAYS = 1
+HISTORY_SHARD_CONCURRENCY = 4
+
 
 def register_analyze_tools(mcp: FastMCP) -> None:
     """Register analysis tools."""
 
-    def _parse_timestamp(value: str) -> datetime | None:
-        if not value:
-            return None
-        try:
-            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            if parsed.tzinfo is None:
-                return parsed.replace(tzinfo=ZoneInfo("America/Los_Angeles"))
-            return parsed
-        except ValueError:
-            return None
-
-    def _normalize_history_payload(payload: Any) -> list[dict[str, Any]]:
+    def _group_history_payload(
+        payload: Any,
+        grouped: dict[str, list[dict[str, Any]]],
+    ) -> None:
+        """Append history entries to the lists of the entities in ``grouped``."""
         if not isinstance(payload, list):
-            return []
-        if payload and isinstance(payload[0], list):
-            items: list[dict[str, Any]] = []
-            for group in payload:
-                if isinstance(group, list):
-                    items.extend(item for item in group if isinstance(item, dict))
-            return items
-        return [item for item in payload if isinstance(item, dict)]
+            return
+        if not payload or not isinstance(payload[0], list):
+            for item in payload:
+                if isinstance(item, dict):
+                    entries = grouped.get(item.get("entity_id"))
+                    if entries is not None:
+                        entries.append(item)
+            return
+        # HA returns one series per entity, so look the target list up per series
+        for group in payload:
+            if not isinstance(group, list):
+                continue
+            entity_id = None
+            entries = None
+            for item in group:
+                if not isinstance(item, dict):
+                    continue
+                # minimal_response only names the entity on a series' first entry
+                item_entity_id = item.setdefault("entity_id", entity_id)
+                if item_entity_id != entity_id:
+                    entity_id = item_entity_id
+                    entries = grouped.get(entity_id)
+                if entries is not None:
+                    entries.append(item)
 
     def _normalize_logbook_payload(payload: Any) -> list[dict[str, Any]]:
         if not isinstance(payload, list):
             return []
         return [item for item in payload if isinstance(item, dict)]
 
-    def _manual_button_ids(
-        states: list[dict[str, Any]],
-    ) -> dict[str, str]:
-        mapping: dict[str, str] = {}
-        suffix = "Add Manual Watering"
-        for state in states:
-            entity_id = state.get("entity_id", "")
-            if not entity_id.startswith("button."):
-                continue
-            attributes = state.get("attributes") or {}
-            friendly = attributes.get("friendly_name", "")
-            if not friendly or not friendly.endswith(f" {suffix}"):
-                continue
-            plant_name = friendly[: -len(suffix) - 1].strip()
-            if plant_name:
-                mapping[plant_name] = entity_id
-        return mapping
-
     def _build_auto_watering_events(
         entries: list[dict[str, Any]],
         kind: str,
@@ -78,29 +86,34 @@ def register_analyze_tools(mcp: FastMCP) -> None:
         current_start: datetime | None = None
         for entry in entries:
             state = entry.get("state")
-            ts = _parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
+            ts = parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
             if not ts:
                 continue
             if state == "on" and current_start is None:
                 current_start = ts
             elif state != "on" and current_start is not None:
                 duration = int((ts - current_start).total_seconds())
+                start = current_start.isoformat()
+                end = ts.isoformat()
                 events.append(
                     {
                         "type": kind,
-                        "start": current_start.isoformat(),
-                        "end": ts.isoformat(),
+                        "start": start,
+                        "end": end,
                         "duration_seconds": duration,
+                        "_key": (kind, start, end, duration, None, None, None, None),
                     }
                 )
                 current_start = None
         if current_start is not None:
+            start = current_start.isoformat()
             events.append(
                 {
                     "type": kind,
-                    "start": current_start.isoformat(),
+                    "start": start,
                     "end": None,
                     "duration_seconds": None,
+                    "_key": (kind, start, None, None, None, None, None, None),
                 }
             )
         return events
@@ -122,27 +135,35 @@ def register_analyze_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for entry in entries:
-            ts = _parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
+            ts = parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
             if not ts:
                 continue
             state = entry.get("state")
             event_data = _extract_event_data(entry)
             if not event_data and state in ("unknown", "unavailable", None):
                 continue
+            start = ts.isoformat()
+            duration_minutes = event_data.get("duration_minutes")
+            amount_ml = event_data.get("amount_ml")
+            notes = event_data.get("notes") or None
+            label = state if state and state not in ("unknown", "unavailable") else None
             event: dict[str, Any] = {
                 "type": "manual",
-                "start": ts.isoformat(),
+                "start": start,
                 "end": None,
                 "duration_seconds": None,
+                "_key": (
+                    "manual", start, None, None, duration_minutes, amount_ml, notes, label
+                ),
             }
-            if event_data.get("duration_minutes") is not None:
-                event["duration_minutes"] = event_data.get("duration_minutes")
-            if event_data.get("amount_ml") is not None:
-                event["amount_ml"] = event_data.get("amount_ml")
-            if event_data.get("notes"):
-                event["notes"] = event_data.get("notes")
-            if state and state not in ("unknown", "unavailable"):
-                event["event"] = state
+            if duration_minutes is not None:
+                event["duration_minutes"] = duration_minutes
+            if amount_ml is not None:
+                event["amount_ml"] = amount_ml
+            if notes:
+                event["notes"] = notes
+            if label:
+                event["event"] = label
             events.append(event)
         return events
 
@@ -155,16 +176,18 @@ def register_analyze_tools(mcp: FastMCP) -> None:
             state = entry.get("state")
             if not state or state == last_state:
                 continue
-            ts = _parse_timestamp(state)
+            ts = parse_timestamp(state)
             if not ts:
                 continue
             last_state = state
+            start = ts.isoformat()
             events.append(
                 {
                     "type": "manual",
-                    "start": ts.isoformat(),
+                    "start": start,
                     "end": None,
                     "duration_seconds": None,
+                    "_key": ("manual", start, None, None, None, None, None, None),
                 }
             )
         return events
@@ -174,15 +197,17 @@ def register_analyze_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for entry in entries:
-            ts = _parse_timestamp(entry.get("when") or entry.get("timestamp") or "")
+            ts = parse_timestamp(entry.get("when") or entry.get("timestamp") or "")
             if not ts:
                 continue
-            message = entry.get("message") or entry.get("state") or ""
+            message = entry.get("message") or entry.get("state") or None
+            start = ts.isoformat()
             event: dict[str, Any] = {
                 "type": "manual",
-                "start": ts.isoformat(),
+                "start": start,
                 "end": None,
                 "duration_seconds": None,
+                "_key": ("manual", start, None, None, None, None, None, message),
             }
             if message:
                 event["event"] = message
@@ -190,25 +215,53 @@ def register_analyze_tools(mcp: FastMCP) -> None:
         return events
 
     def _dedupe_events(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Builders attach a "_key" projection of the identifying fields
         seen: set[tuple[Any, ...]] = set()
         deduped: list[dict[str, Any]] = []
         for event in events:
-            key = (
-                event.get("type"),
-                event.get("start"),
-                event.get("end"),
-                event.get("duration_seconds"),
-                event.get("duration_minutes"),
-                event.get("amount_ml"),
-                event.get("notes"),
-                event.get("event"),
-            )
+            key = event.pop("_key")
             if key in seen:
                 continue
             seen.add(key)
             deduped.append(event)
         return deduped
 
+    async def _fetch_history_slices(
+        start_time: datetime,
+        end_time: datetime,
+        params: dict[str, str],
+    ) -> tuple[int, Any | None, str | None]:
+        """Fetch history in day slices and merge their per-entity series."""
+        semaphore = asyncio.Semaphore(HISTORY_SHARD_CONCURRENCY)
+        slice_length = timedelta(days=HISTORY_SHARD_DAYS)
+
+        async def fetch_slice(
+            slice_start: datetime, slice_end: datetime
+        ) -> tuple[int, Any | None, str | None]:
+            async with semaphore:
+                return await ha_request(
+                    "GET",
+                    f"/api/history/period/{slice_start.isoformat()}",
+                    params={**params, "end_time": slice_end.isoformat()},
+                )
+
+        bounds: list[tuple[datetime, datetime]] = []
+        slice_start = start_time
+        while slice_start < end_time:
+            slice_end = min(slice_start + slice_length, end_time)
+            bounds.append((slice_start, slice_end))
+            slice_start = slice_end
+        responses = await asyncio.gather(
+            *(fetch_slice(slice_start, slice_end) for slice_start, slice_end in bounds)
+        )
+        merged: list[Any] = []
+        for status, history, error in responses:
+            if error:
+                return status, None, error
+            if isinstance(history, list):
+                merged.extend(history)
+        return 200, merged, None
+
     @mcp.tool
     async def analyze___get_plant_history(
         identifier: str,
@@ -219,6 +272,11 @@ def register_analyze_tools(mcp: FastMCP) -> None:
         """Return history for plant sensors and watering events."""
         if days <= 0:
             return {"status": "error", "error": "Days must be positive"}
+        if days > MAX_HISTORY_DAYS:
+            return {
+                "status": "error",
+                "error": f"Days must be at most {MAX_HISTORY_DAYS}",
+            }
         if step_hours <= 0:
             return {"status": "error", "error": "step_hours must be positive"}
         details_value = details.strip().lower() if details else "main"
@@ -227,11 +285,11 @@ def register_analyze_tools(mcp: FastMCP) -> None:
                 "status": "error",
                 "error": "details must be 'main' or 'full'",
             }
-        states, error = await get_states_list()
+        states, error = await get_plant_states_list()
         if error:
             return {"status": "error", "error": error}
         plants = parse_plants_from_states(states)
-        manual_button_entities = _manual_button_ids(states)
+        manual_button_entities = parse_manual_buttons(states)["manual_watering"]
         plant_name = match_plant_name(plants.keys(), identifier)
         if not plant_name:
             return {"status": "error", "error": "Plant not found"}
@@ -265,39 +323,84 @@ def register_analyze_tools(mcp: FastMCP) -> None:
             }
 
         start_time, end_time = history_window(days)
-        _, history, error = await ha_request(
-            "GET",
-            f"/api/history/period/{start_time.isoformat()}",
-            params={
-                "end_time": end_time.isoformat(),
-                "filter_entity_id": ",".join(history_ids),
-            },
-        )
-        if error:
-            return {"status": "error", "error": error}
-        history_items = _normalize_history_payload(history)
-        grouped: dict[str, list[dict[str, Any]]] = {eid: [] for eid in history_ids}
-        for item in history_items:
-            entity_id = item.get("entity_id")
-            if entity_id not in grouped:
-                continue
-            grouped[entity_id].append(item)
-        for entries in grouped.values():
-            entries.sort(
-                key=lambda entry: _parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
-                or datetime.min.replace(tzinfo=ZoneInfo("America/Los_Angeles"))
-            )
-        logbook_by_entity: dict[str, list[dict[str, Any]]] = {}
+        start_iso = start_time.isoformat()
+        end_iso = end_time.isoformat()
+        history_path = f"/api/history/period/{start_iso}"
         manual_id = watering_entities.get("manual")
+        # Only the manual watering event needs attributes (its event_data); other
+        # series are read for state and time alone, so let HA trim them
+        state_only_ids = [eid for eid in history_ids if eid != manual_id]
+        requests = []
+        if state_only_ids:
+            state_params = {
+                "filter_entity_id": ",".join(state_only_ids),
+                "minimal_response": "true",
+                "no_attributes": "true",
+            }
+            num_points = days * 24 // step_hours + 1
+            if num_points * len(history_ids) > HISTORY_SHARD_THRESHOLD:
+                # Slices repeat each series' state at their start; repeated
+                # states do not change points or events
+                requests.append(
+                    _fetch_history_slices(start_time, end_time, state_params)
+                )
+            else:
+                requests.append(
+                    ha_request(
+                        "GET",
+                        history_path,
+                        params={"end_time": end_iso, **state_params},
+                    )
+                )
         if manual_id:
-            _, logbook, log_error = await ha_request(
-                "GET",
-                f"/api/logbook/period/{start_time.isoformat()}",
-                params={
-                    "end_time": end_time.isoformat(),
-                    "entity_id": manual_id,
-                },
+            requests.append(
+                ha_request(
+                    "GET",
+                    history_path,
+                    params={
+                        "end_time": end_iso,
+                        "filter_entity_id": manual_id,
+                    },
+                )
+            )
+            # The logbook lookup does not depend on history, so overlap them
+            requests.append(
+                ha_request(
+                    "GET",
+                    f"/api/logbook/period/{start_iso}",
+                    params={
+                        "end_time": end_iso,
+                        "entity_id": manual_id,
+                    },
+                )
+            )
+        responses = await asyncio.gather(*requests)
+        logbook_response = responses.pop() if manual_id else None
+        grouped: dict[str, list[dict[str, Any]]] = {eid: [] for eid in history_ids}
+        for _, history, error in responses:
+            if error:
+                return {"status": "error", "error": error}
+            _group_history_payload(history, grouped)
+        # Parse each entry's timestamp once and keep the sorted times alongside;
+        # HA series arrive in order, which the sort only has to confirm
+        entry_times: dict[str, list[datetime]] = {}
+        for entity_id, entries in grouped.items():
+            keyed = sorted(
+                (
+                    (
+                        parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
+                        or _MIN_DT,
+                        entry,
+                    )
+                    for entry in entries
+                ),
+                key=itemgetter(0),
             )
+            grouped[entity_id] = [entry for _, entry in keyed]
+            entry_times[entity_id] = [ts for ts, _ in keyed]
+        logbook_by_entity: dict[str, list[dict[str, Any]]] = {}
+        if logbook_response is not None:
+            _, logbook, log_error = logbook_response
             if not log_error:
                 log_items = _normalize_logbook_payload(logbook)
                 for item in log_items:
@@ -305,18 +408,6 @@ def register_analyze_tools(mcp: FastMCP) -> None:
                     if entity_id == manual_id:
                         logbook_by_entity.setdefault(entity_id, []).append(item)
 
-        def last_state_before(
-            entries: list[dict[str, Any]],
-            timestamp: datetime,
-        ) -> dict[str, Any] | None:
-            last = None
-            for entry in entries:
-                ts = _parse_timestamp(entry.get("last_changed") or entry.get("last_updated") or "")
-                if not ts or ts > timestamp:
-                    break
-                last = entry
-            return last
-
         auto_events = _build_auto_watering_events(
             grouped.get(watering_entities.get("auto") or "", []),
             "auto",
@@ -338,36 +429,66 @@ def register_analyze_tools(mcp: FastMCP) -> None:
             )
         all_events = auto_events + manual_events
         all_events = _dedupe_events(all_events)
-        all_events.sort(key=lambda item: item.get("start") or "")
+        # Parse event bounds once and order by start datetime so each point can
+        # bisect; slices of this list are already in start order
+        timed_events: list[tuple[datetime, datetime | None, dict[str, Any]]] = []
+        for event in all_events:
+            event_start = parse_timestamp(event.get("start") or "")
+            if not event_start:
+                continue
+            event_end = (
+                parse_timestamp(event.get("end") or "") if event.get("end") else None
+            )
+            timed_events.append((event_start, event_end, event))
+        timed_events.sort(key=itemgetter(0))
+        event_starts = [event_start for event_start, _, _ in timed_events]
 
         points = []
         step_seconds = step_hours * 3600
         start_epoch = int(start_time.timestamp())
         end_epoch = int(end_time.timestamp())
-        for ts_epoch in range(end_epoch, start_epoch - 1, -step_seconds):
-            ts = datetime.fromtimestamp(ts_epoch, tz=ZoneInfo("America/Los_Angeles"))
-            period_start = ts - timedelta(seconds=step_seconds)
-            point = {"timestamp": ts.isoformat()}
+        point_times = [
+            datetime.fromtimestamp(ts_epoch, tz=LA_TZ)
+            for ts_epoch in range(end_epoch, start_epoch - 1, -step_seconds)
+        ]
+        end_time_point = point_times[0]
+        step = timedelta(seconds=step_seconds)
+        last_point = len(point_times) - 1
+        # Drop each entry into the bucket of the earliest point that sees it (the
+        # last write wins since entries are sorted), then carry states forward
+        point_states: dict[str, list[Any]] = {}
+        for entity_id in entity_ids.values():
+            if not entity_id or entity_id in point_states:
+                continue
+            buckets: list[Any] = [_EMPTY] * len(point_times)
+            for entry_ts, entry in zip(
+                entry_times.get(entity_id, []), grouped.get(entity_id, [])
+            ):
+                if entry_ts > end_time_point:
+                    break
+                index = min((end_time_point - entry_ts) // step, last_point)
+                buckets[index] = entry.get("state")
+            value = None
+            for index in range(last_point, -1, -1):
+                if buckets[index] is _EMPTY:
+                    buckets[index] = value
+                else:
+                    value = buckets[index]
+            point_states[entity_id] = buckets
+        for point_index, ts in enumerate(point_times):
+            period_start = ts - step
+            ts_iso = ts.isoformat()
+            point = {"timestamp": ts_iso}
             for key, entity_id in entity_ids.items():
-                if not entity_id:
-                    point[key] = None
-                    continue
-                entry = last_state_before(grouped.get(entity_id, []), ts)
-                point[key] = entry.get("state") if entry else None
-            events_in_period = []
-            for event in all_events:
-                event_start = _parse_timestamp(event.get("start") or "")
-                event_end = (
-                    _parse_timestamp(event.get("end") or "") if event.get("end") else None
-                )
-                if not event_start:
-                    continue
-                overlaps = event_start < ts and (event_end is None or event_end > period_start)
-                if overlaps:
-                    events_in_period.append(event)
-            events_in_period.sort(key=lambda item: item.get("start") or "")
+                point[key] = point_states[entity_id][point_index] if entity_id else None
+            # Only events starting before ts can overlap the period
+            events_in_period = [
+                event
+                for _, event_end, event in timed_events[: bisect_left(event_starts, ts)]
+                if event_end is None or event_end > period_start
+            ]
             point["period_start"] = period_start.isoformat()
-            point["period_end"] = ts.isoformat()
+            point["period_end"] = ts_iso
             point["watering_events"] = events_in_period
             points.append(point)
 
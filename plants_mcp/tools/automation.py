@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from fastmcp import FastMCP
 
 from .common import (
+    cached_get,
     collect_entity_ids,
     get_states_list,
     ha_request,
+    index_states_by_domain,
+    invalidate_cache,
     new_automation_id,
     parse_plants_from_states,
 )
 
+# Automation configs fetched from Home Assistant at once
+CONFIG_FETCH_CONCURRENCY = 8
+
 
 def register_automation_tools(mcp: FastMCP) -> None:
     """Register automation tools."""
@@ -36,20 +43,24 @@ def register_automation_tools(mcp: FastMCP) -> None:
             return {"status": "success", "outlets": [], "automations": []}
 
         matched = []
-        automation_states = [
-            state
-            for state in states
-            if state.get("entity_id", "").startswith("automation.")
+        candidates = [
+            (state, automation_id)
+            for state in index_states_by_domain(states).get("automation", [])
+            if (automation_id := state.get("attributes", {}).get("id"))
         ]
-        for state in automation_states:
+        semaphore = asyncio.Semaphore(CONFIG_FETCH_CONCURRENCY)
+
+        async def fetch_config(automation_id: str) -> tuple[Any | None, str | None]:
+            async with semaphore:
+                return await cached_get(
+                    f"/api/config/automation/config/{automation_id}"
+                )
+
+        configs = await asyncio.gather(
+            *(fetch_config(automation_id) for _, automation_id in candidates)
+        )
+        for (state, automation_id), (config, error) in zip(candidates, configs):
             attributes = state.get("attributes", {})
-            automation_id = attributes.get("id")
-            if not automation_id:
-                continue
-            _, config, error = await ha_request(
-                "GET",
-                f"/api/config/automation/config/{automation_id}",
-            )
             if error or not isinstance(config, dict):
                 continue
             entity_ids = collect_entity_ids(config)
@@ -85,6 +96,7 @@ def register_automation_tools(mcp: FastMCP) -> None:
             f"/api/config/automation/config/{automation_id}",
             json=payload,
         )
+        invalidate_cache(f"/api/config/automation/config/{automation_id}")
         if error:
             return {"status": "error", "error": error}
         return {"status": "success", "id": automation_id, "automation": result}
@@ -99,6 +111,7 @@ def register_automation_tools(mcp: FastMCP) -> None:
             "DELETE",
             f"/api/config/automation/config/{automation_id}",
         )
+        invalidate_cache(f"/api/config/automation/config/{automation_id}")
         if error:
             return {"status": "error", "error": error}
         return {"status": "success", "deleted": automation_id}
@@ -119,6 +132,7 @@ def register_automation_tools(mcp: FastMCP) -> None:
             f"/api/config/automation/config/{automation_id}",
             json=payload,
         )
+        invalidate_cache(f"/api/config/automation/config/{automation_id}")
         if error:
             return {"status": "error", "error": error}
         return {"status": "success", "automation": result}
@@ -4,13 +4,31 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import os
-from typing import Any, Iterable
+import time
+from typing import Any, Callable, Collection
 import uuid
 from zoneinfo import ZoneInfo
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # orjson is a speedup only; fall back to the stdlib
+    orjson = None
+    import json as _stdlib_json
+
+try:
+    import h2  # noqa: F401  # httpx needs it to negotiate HTTP/2
+except ImportError:  # HTTP/2 is a speedup only; fall back to HTTP/1.1
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+# Local time zone of the Home Assistant instance
+LA_TZ = ZoneInfo("America/Los_Angeles")
+
 PLANT_SUFFIXES = {
     "moisture": "Soil Moisture State",
     "moisture_source": "Soil Moisture Device Source",
@@ -38,7 +56,25 @@ PLANT_SUFFIXES = {
 }
 
 
+def _index_suffixes() -> dict[str, tuple[tuple[str, str, str], ...]]:
+    # Group PLANT_SUFFIXES by final word so a name only checks suffixes that can
+    # match; each entry also holds the suffix with its separating space
+    index: dict[str, list[tuple[str, str, str]]] = {}
+    for key, suffix in PLANT_SUFFIXES.items():
+        index.setdefault(suffix.rpartition(" ")[2], []).append(
+            (f" {suffix}", suffix, key)
+        )
+    return {word: tuple(candidates) for word, candidates in index.items()}
+
+
+_SUFFIXES_BY_LAST_WORD = _index_suffixes()
+# Plant dict keys holding each suffix's entity id
+_ENTITY_ID_KEYS = {key: f"{key}_entity_id" for key in PLANT_SUFFIXES}
+
+
+@lru_cache(maxsize=1)
 def _get_ha_config() -> tuple[str, str] | None:
+    # Read once; close_client clears this so a restart picks up new settings
     ha_token = os.getenv("HA_TOKEN", "")
     ha_url = os.getenv("HA_URL", "http://homeassistant.local:8123").rstrip("/")
     if not ha_token:
@@ -46,6 +82,101 @@ def _get_ha_config() -> tuple[str, str] | None:
     return ha_url, ha_token
 
 
+# Seconds a cached GET response stays fresh
+CACHE_TTL = 30.0
+# Seconds the full states list is reused across tool calls
+STATES_CACHE_TTL = 3.0
+STATES_PATH = "/api/states"
+# Extra attempts when connecting to Home Assistant fails
+HTTP_CONNECT_RETRIES = 2
+# Bytes of an error response body reported back to the caller
+ERROR_BODY_LIMIT = 2048
+
+_client: httpx.AsyncClient | None = None
+_cache: dict[str, tuple[float, Any]] = {}
+_cache_locks: dict[str, asyncio.Lock] = {}
+# Bumped by invalidate_cache so in-flight reads do not store stale responses
+_cache_generations: dict[str, int] = {}
+# Parsed plants reused for name lookups, with the time they were parsed
+_plant_index: tuple[float, dict[str, dict[str, Any]]] | None = None
+# Last states list filtered down to plant states
+_plant_states_snapshot: (
+    tuple[list[dict[str, Any]], list[dict[str, Any]]] | None
+) = None
+# Last states list grouped by entity domain
+_domain_snapshot: (
+    tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]] | None
+) = None
+# Last states list parsed into plants, held so its identity stays unique
+_parsed_snapshot: (
+    tuple[
+        list[dict[str, Any]],
+        dict[str, dict[str, Any]],
+        dict[str, dict[str, str]],
+    ]
+    | None
+) = None
+
+
+def _get_client() -> httpx.AsyncClient | None:
+    """Return the shared Home Assistant client, creating it on first use."""
+    global _client
+    if _client is None:
+        config = _get_ha_config()
+        if not config:
+            return None
+        ha_url, ha_token = config
+        _client = httpx.AsyncClient(
+            base_url=ha_url,
+            headers={
+                "Authorization": f"Bearer {ha_token}",
+                "Content-Type": "application/json",
+            },
+            timeout=15,
+            # Concurrent history/logbook/config calls share one connection when
+            # h2 is installed and the server (usually a TLS proxy in front of
+            # HA) negotiates HTTP/2.
+            # The transport retries failed connects, e.g. while HA restarts.
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                retries=HTTP_CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=20
+                ),
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Home Assistant client and its pooled connections."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+    _get_ha_config.cache_clear()
+
+
+def json_dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Encode JSON with orjson when available, matching its compact output."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return _stdlib_json.dumps(
+        obj, default=default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return _stdlib_json.loads(data)
+
+
+def _body_excerpt(response: httpx.Response) -> str:
+    # Error pages from proxies can be large; only the start is useful
+    return response.content[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
+
 async def ha_request(
     method: str,
     path: str,
@@ -53,42 +184,80 @@ async def ha_request(
     params: dict[str, Any] | None = None,
     json: dict[str, Any] | None = None,
 ) -> tuple[int, Any | None, str | None]:
-    config = _get_ha_config()
-    if not config:
+    client = _get_client()
+    if client is None:
         return 0, None, "HA_TOKEN is not set"
-    ha_url, ha_token = config
-    headers = {
-        "Authorization": f"Bearer {ha_token}",
-        "Content-Type": "application/json",
-    }
-    url = f"{ha_url}{path}"
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json=json,
-            )
+        # The client already sends a JSON Content-Type; encode bodies ourselves
+        response = await client.request(
+            method,
+            path,
+            params=params,
+            content=json_dumps(json) if json is not None else None,
+        )
     except httpx.HTTPError as exc:
+        if method != "GET":
+            invalidate_cache(STATES_PATH)
         return 0, None, f"Home Assistant request failed: {exc}"
+    if method != "GET":
+        # Service calls change entity states; refetch them on the next read
+        invalidate_cache(STATES_PATH)
+        if path.startswith("/api/services/plants/"):
+            invalidate_plant_index()
     if response.status_code >= 400:
-        return response.status_code, None, response.text
-    if not response.content:
+        return response.status_code, None, _body_excerpt(response)
+    # Service calls often answer 204 or an explicit empty body
+    if (
+        response.status_code == 204
+        or response.headers.get("content-length") == "0"
+        or not response.content
+    ):
         return response.status_code, None, None
     try:
-        return response.status_code, response.json(), None
-    except ValueError:
+        return response.status_code, json_loads(response.content), None
+    except ValueError:  # both decoders raise ValueError subclasses
         return (
             response.status_code,
             None,
-            f"Unexpected non-JSON response: {response.text}",
+            f"Unexpected non-JSON response: {_body_excerpt(response)}",
         )
 
 
+async def warm_up() -> None:
+    """Open a pooled connection to Home Assistant before the first tool call."""
+    await ha_request("GET", "/api/")
+
+
+async def cached_get(
+    path: str, ttl: float = CACHE_TTL
+) -> tuple[Any | None, str | None]:
+    """GET a rarely changing resource, reusing the response for ``ttl`` seconds."""
+    lock = _cache_locks.get(path)
+    if lock is None:
+        lock = _cache_locks[path] = asyncio.Lock()
+    # Concurrent callers for the same path wait for a single fetch
+    async with lock:
+        cached = _cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1], None
+        generation = _cache_generations.get(path, 0)
+        _, data, error = await ha_request("GET", path)
+        # Skip the store if the path was invalidated while the request ran
+        if not error and _cache_generations.get(path, 0) == generation:
+            _cache[path] = (time.monotonic(), data)
+        return data, error
+
+
+def invalidate_cache(path: str) -> None:
+    _cache.pop(path, None)
+    _cache_generations[path] = _cache_generations.get(path, 0) + 1
+    # The next read recreates the lock, so per-entity paths do not pile up
+    _cache_locks.pop(path, None)
+
+
 async def get_states_list() -> tuple[list[dict[str, Any]], str | None]:
-    _, data, error = await ha_request("GET", "/api/states")
+    """Return all states; the list is shared for a few seconds, do not mutate."""
+    data, error = await cached_get(STATES_PATH, STATES_CACHE_TTL)
     if error:
         return [], error
     if not isinstance(data, list):
@@ -96,13 +265,110 @@ async def get_states_list() -> tuple[list[dict[str, Any]], str | None]:
     return data, None
 
 
-def match_plant_name(names: Iterable[str], identifier: str) -> str | None:
+async def get_plant_states_list() -> tuple[list[dict[str, Any]], str | None]:
+    """Return only states named after a plant, dropping the rest right away."""
+    global _plant_states_snapshot
+    states, error = await get_states_list()
+    if error:
+        return [], error
+    # Reuse the filtered list for a cached snapshot so parsing stays memoized
+    if _plant_states_snapshot is not None and _plant_states_snapshot[0] is states:
+        return _plant_states_snapshot[1], None
+    plant_states = [
+        state
+        for state in states
+        if split_plant_suffix(
+            (state.get("attributes") or {}).get("friendly_name") or ""
+        )
+    ]
+    _plant_states_snapshot = (states, plant_states)
+    return plant_states, None
+
+
+def index_states_by_domain(
+    states: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Group states by entity domain; the result is shared, do not mutate."""
+    global _domain_snapshot
+    if _domain_snapshot is not None and _domain_snapshot[0] is states:
+        return _domain_snapshot[1]
+    index: dict[str, list[dict[str, Any]]] = {}
+    for state in states:
+        entity_id = state.get("entity_id")
+        if entity_id:
+            index.setdefault(entity_id.partition(".")[0], []).append(state)
+    _domain_snapshot = (states, index)
+    return index
+
+
+async def get_plant_index() -> tuple[dict[str, dict[str, Any]], str | None]:
+    """Return parsed plants for resolving names and entity ids.
+
+    The snapshot may be up to CACHE_TTL old, so entity states in it can be
+    stale; read live states with get_state.
+    """
+    global _plant_index
+    if _plant_index is not None and time.monotonic() - _plant_index[0] < CACHE_TTL:
+        return _plant_index[1], None
+    states, error = await get_plant_states_list()
+    if error:
+        return {}, error
+    plants = parse_plants_from_states(states)
+    _plant_index = (time.monotonic(), plants)
+    return plants, None
+
+
+def invalidate_plant_index() -> None:
+    global _plant_index
+    _plant_index = None
+    # A rebuilt index should not come from a just as stale states snapshot
+    invalidate_cache(STATES_PATH)
+
+
+async def find_plant(
+    identifier: str, refresh: bool = False
+) -> tuple[str | None, dict[str, Any] | None, str | None]:
+    """Resolve a plant through the plant index as (name, plant, error).
+
+    A miss on a cached index is retried once against fresh states, so plants
+    added or renamed in HA since the index was built are still found.
+    """
+    if refresh:
+        invalidate_plant_index()
+    cached = (
+        _plant_index is not None
+        and time.monotonic() - _plant_index[0] < CACHE_TTL
+    )
+    plants, error = await get_plant_index()
+    if error:
+        return None, None, error
+    plant_name = match_plant_name(plants.keys(), identifier)
+    if plant_name is None:
+        if cached:
+            return await find_plant(identifier, refresh=True)
+        return None, None, None
+    return plant_name, plants[plant_name], None
+
+
+async def get_state(entity_id: str) -> tuple[dict[str, Any] | None, str | None]:
+    """Fetch one entity's current state; None when HA does not know it."""
+    status, data, error = await ha_request("GET", f"/api/states/{entity_id}")
+    if status == 404:
+        return None, None
+    if error:
+        return None, error
+    if not isinstance(data, dict):
+        return None, "Unexpected state response"
+    return data, None
+
+
+def match_plant_name(names: Collection[str], identifier: str) -> str | None:
     candidate = identifier.strip()
     if not candidate:
         return None
-    for name in names:
-        if name == candidate:
-            return name
+    # Callers pass dict keys, so the exact match is a hash lookup
+    if candidate in names:
+        return candidate
     lowered = candidate.lower()
     for name in names:
         if name.lower() == lowered:
@@ -110,18 +376,29 @@ def match_plant_name(names: Iterable[str], identifier: str) -> str | None:
     return None
 
 
-def sanitize_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
-    if "options" not in attributes:
-        return attributes
-    cleaned = dict(attributes)
-    cleaned.pop("options", None)
-    return cleaned
+def split_plant_suffix(friendly_name: str) -> tuple[str, str, str] | None:
+    """Split a friendly name into plant name, suffix key and suffix."""
+    candidates = _SUFFIXES_BY_LAST_WORD.get(friendly_name.rpartition(" ")[2], ())
+    for spaced_suffix, suffix, key in candidates:
+        plant_name = friendly_name.removesuffix(spaced_suffix)
+        if plant_name is not friendly_name:
+            return plant_name, key, suffix
+    return None
 
 
-def parse_plants_from_states(
-    states: Iterable[dict[str, Any]],
-) -> dict[str, dict[str, Any]]:
+# Friendly name word preceding the manual suffix on the record buttons
+_MANUAL_BUTTON_PREFIX = " Add"
+_MANUAL_KEYS = ("manual_watering", "manual_shower")
+
+
+def _parse_states(
+    states: list[dict[str, Any]],
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, str]]]:
+    global _parsed_snapshot
+    if _parsed_snapshot is not None and _parsed_snapshot[0] is states:
+        return _parsed_snapshot[1], _parsed_snapshot[2]
     plants: dict[str, dict[str, Any]] = {}
+    buttons: dict[str, dict[str, str]] = {key: {} for key in _MANUAL_KEYS}
     for state in states:
         entity_id = state.get("entity_id")
         if not entity_id:
@@ -131,15 +408,16 @@ def parse_plants_from_states(
         friendly = attributes.get("friendly_name", "")
         if not friendly:
             continue
-        matched_key = None
-        for key, suffix in PLANT_SUFFIXES.items():
-            if friendly.endswith(f" {suffix}"):
-                matched_key = key
-                plant_name = friendly[: -len(suffix) - 1]
-                break
-        if not matched_key:
+        split = split_plant_suffix(friendly)
+        if split is None:
             continue
-        if matched_key in ("manual_watering", "manual_shower") and domain == "button":
+        plant_name, matched_key, _ = split
+        if matched_key in _MANUAL_KEYS and domain == "button":
+            # "<plant> Add Manual Watering" buttons are collected in this pass too
+            if plant_name.endswith(_MANUAL_BUTTON_PREFIX):
+                button_plant = plant_name.removesuffix(_MANUAL_BUTTON_PREFIX).strip()
+                if button_plant:
+                    buttons[matched_key][button_plant] = entity_id
             continue
         plant_name = plant_name.strip()
         if not plant_name:
@@ -152,30 +430,49 @@ def parse_plants_from_states(
             {
                 "entity_id": entity_id,
                 "state": state.get("state"),
-                "attributes": sanitize_attributes(attributes),
+                # Shared with the state, not copied; tools only read it
+                "attributes": attributes,
             }
         )
-        plant_info[f"{matched_key}_entity_id"] = entity_id
+        plant_info[_ENTITY_ID_KEYS[matched_key]] = entity_id
         plant_info[matched_key] = state.get("state")
-    return plants
+    _parsed_snapshot = (states, plants, buttons)
+    return plants, buttons
+
+
+def parse_plants_from_states(
+    states: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Group plant entities by plant name; the result is shared, do not mutate."""
+    return _parse_states(states)[0]
+
+
+def parse_manual_buttons(
+    states: list[dict[str, Any]],
+) -> dict[str, dict[str, str]]:
+    """Map manual_watering/manual_shower to plant name -> record button id."""
+    return _parse_states(states)[1]
 
 
 def collect_entity_ids(payload: Any) -> set[str]:
     entity_ids: set[str] = set()
-    if isinstance(payload, dict):
-        for key, value in payload.items():
-            if key == "entity_id":
-                if isinstance(value, str):
-                    entity_ids.add(value)
-                elif isinstance(value, list):
-                    entity_ids.update(
-                        item for item in value if isinstance(item, str)
-                    )
-            else:
-                entity_ids.update(collect_entity_ids(value))
-    elif isinstance(payload, list):
-        for item in payload:
-            entity_ids.update(collect_entity_ids(item))
+    # Walk nested automation configs with an explicit stack instead of recursion
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == "entity_id":
+                    if isinstance(value, str):
+                        entity_ids.add(value)
+                    elif isinstance(value, list):
+                        entity_ids.update(
+                            item for item in value if isinstance(item, str)
+                        )
+                else:
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
     return entity_ids
 
 
@@ -193,8 +490,24 @@ def new_automation_id(value: str) -> str:
     return trimmed or uuid.uuid4().hex
 
 
+@lru_cache(maxsize=8192)
+def parse_timestamp(value: str) -> datetime | None:
+    """Parse an HA ISO timestamp; naive values are taken as Los Angeles time."""
+    # History and logbook entries repeat the same strings, and datetimes are
+    # immutable, so parsed values are shared between callers
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=LA_TZ)
+        return parsed
+    except ValueError:
+        return None
+
+
 def history_window(days: int) -> tuple[datetime, datetime]:
-    end_time = datetime.now(ZoneInfo("America/Los_Angeles"))
+    end_time = datetime.now(LA_TZ)
     start_time = end_time - timedelta(days=days)
     return start_time, end_time
 
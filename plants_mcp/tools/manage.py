@@ -2,77 +2,69 @@
 
 from __future__ import annotations
 
+import asyncio
+from operator import itemgetter
 from typing import Any
 
 from fastmcp import FastMCP
 
 from .common import (
-    PLANT_SUFFIXES,
-    get_states_list,
+    find_plant,
+    get_plant_states_list,
     ha_request,
     match_plant_name,
     parse_plants_from_states,
 )
 
+# Editable field domains: select (configuration) and text (recommendations)
+_FIELD_CATEGORIES = {"select": "configuration", "text": "recommendations"}
+
 
 def register_manage_tools(mcp: FastMCP) -> None:
     """Register management tools."""
 
-    async def _get_plant_fields_info_internal(plant_name: str) -> dict[str, Any]:
-        """Internal helper to get plant fields info without tool decorator."""
-        states, error = await get_states_list()
-        if error:
-            return {"status": "error", "error": error}
+    def _compute_plant_fields(
+        states: list[dict[str, Any]],
+        plant_name: str,
+        only_ids: set[str] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """Build plant fields info and the same fields keyed by entity_id.
 
+        With ``only_ids`` just those fields are built and left unsorted.
+        """
         # Parse all plants to find the target
         plants_data = parse_plants_from_states(states)
         matched_name = match_plant_name(plants_data.keys(), plant_name)
         if not matched_name:
-            return {"status": "error", "error": "Plant not found"}
+            return {"status": "error", "error": "Plant not found"}, {}
 
         # Collect fields for the specific plant
         plant_fields: dict[str, list[dict[str, Any]]] = {
             "recommendations": [],
             "configuration": [],
         }
+        fields_by_entity_id: dict[str, dict[str, Any]] = {}
 
-        for state in states:
-            entity_id = state.get("entity_id")
-            if not entity_id:
+        # Entities of the target plant were already matched while parsing
+        for entity in plants_data[matched_name]["entities"]:
+            entity_id = entity["entity_id"]
+            if only_ids is not None and entity_id not in only_ids:
                 continue
-            attributes = state.get("attributes", {})
+            attributes = entity["attributes"]
             friendly = attributes.get("friendly_name", "")
-            if not friendly:
-                continue
-
-            # Check if this entity belongs to the target plant
-            matched_key = None
-            entity_plant_name = None
-            for key, suffix in PLANT_SUFFIXES.items():
-                if friendly.endswith(f" {suffix}"):
-                    matched_key = key
-                    entity_plant_name = friendly[: -len(suffix) - 1].strip()
-                    break
-
-            if not matched_key or entity_plant_name != matched_name:
-                continue
 
-            domain = entity_id.split(".")[0]
+            domain = entity_id.partition(".")[0]
 
-            # Only include select (configuration) and text (recommendations)
-            if domain == "select":
-                category = "configuration"
-            elif domain == "text":
-                category = "recommendations"
-            else:
-                # Skip controls and sensors
+            # Skip controls and sensors
+            category = _FIELD_CATEGORIES.get(domain)
+            if category is None:
                 continue
 
             # Build field info with only relevant fields
             field_info: dict[str, Any] = {
                 "type": domain,
                 "name": friendly,
-                "current_value": state.get("state"),
+                "current_value": entity["state"],
                 "required": False,
                 "entity_id": entity_id,
             }
@@ -89,16 +81,18 @@ def register_manage_tools(mcp: FastMCP) -> None:
                     field_info["example"] = example
 
             plant_fields[category].append(field_info)
+            fields_by_entity_id[entity_id] = field_info
 
         # Sort fields by name
-        for key in plant_fields:
-            plant_fields[key].sort(key=lambda item: item.get("name") or "")
+        if only_ids is None:
+            for key in plant_fields:
+                plant_fields[key].sort(key=itemgetter("name"))
 
         return {
             "status": "success",
             "plant": matched_name,
             "fields": plant_fields,
-        }
+        }, fields_by_entity_id
 
     @mcp.tool
     async def manage___add_plant(
@@ -106,11 +100,13 @@ def register_manage_tools(mcp: FastMCP) -> None:
         moisture_entity_id: str = "",
     ) -> dict[str, Any]:
         """Create a new plant device via the Plants service."""
-        if not name.strip():
+        name = name.strip()
+        if not name:
             return {"status": "error", "error": "Name is required"}
-        user_input: dict[str, Any] = {"name": name.strip()}
-        if moisture_entity_id.strip():
-            user_input["moisture_entity_id"] = moisture_entity_id.strip()
+        user_input: dict[str, Any] = {"name": name}
+        moisture_entity_id = moisture_entity_id.strip()
+        if moisture_entity_id:
+            user_input["moisture_entity_id"] = moisture_entity_id
         _, _, error = await ha_request(
             "POST",
             "/api/services/plants/add_plant",
@@ -118,16 +114,14 @@ def register_manage_tools(mcp: FastMCP) -> None:
         )
         if error:
             return {"status": "error", "error": error}
-        return {"status": "success", "name": name.strip()}
+        return {"status": "success", "name": name}
 
     @mcp.tool
     async def manage___remove_plant(identifier: str) -> dict[str, Any]:
         """Delete a plant device via the Plants service."""
-        states, error = await get_states_list()
+        plant_name, _, error = await find_plant(identifier)
         if error:
             return {"status": "error", "error": error}
-        plants = parse_plants_from_states(states)
-        plant_name = match_plant_name(plants.keys(), identifier)
         if not plant_name:
             return {"status": "error", "error": "Plant not found"}
         _, _, error = await ha_request(
@@ -142,7 +136,10 @@ def register_manage_tools(mcp: FastMCP) -> None:
     @mcp.tool
     async def manage___get_plant_fields_info(plant_name: str) -> dict[str, Any]:
         """Get editable plant fields metadata."""
-        return await _get_plant_fields_info_internal(plant_name)
+        states, error = await get_plant_states_list()
+        if error:
+            return {"status": "error", "error": error}
+        return _compute_plant_fields(states, plant_name)[0]
 
     @mcp.tool
     async def manage___set_plant_fields(
@@ -160,16 +157,18 @@ def register_manage_tools(mcp: FastMCP) -> None:
             return {"status": "error", "error": "No fields provided"}
 
         # Get current plant fields info for validation
-        fields_info_result = await _get_plant_fields_info_internal(plant_name)
+        states, error = await get_plant_states_list()
+        if error:
+            return {"status": "error", "error": error}
+        # Validation only looks fields up by entity_id, so build just those
+        fields_info_result, editable_fields = _compute_plant_fields(
+            states,
+            plant_name,
+            {field.get("entity_id") for field in fields},
+        )
         if fields_info_result["status"] != "success":
             return fields_info_result
 
-        # Build a map of entity_id -> field_info for validation
-        editable_fields: dict[str, dict[str, Any]] = {}
-        for category in ["configuration", "recommendations"]:
-            for field in fields_info_result["fields"][category]:
-                editable_fields[field["entity_id"]] = field
-
         # Validate and prepare service calls
         errors = []
         updates = []
@@ -238,21 +237,27 @@ def register_manage_tools(mcp: FastMCP) -> None:
                 "errors": errors,
             }
 
-        # Execute all updates
-        results = []
-        for update in updates:
-            service_path = update["service"]
-            entity_id = update["entity_id"]
+        # Execute all updates; they are independent service calls, so run them together
+        async def _apply(update: dict[str, Any]) -> str | None:
             data = update["data"]
-            data["entity_id"] = entity_id
-
-            domain, service = service_path.split("/")
+            data["entity_id"] = update["entity_id"]
+            domain, service = update["service"].split("/")
             _, _, error = await ha_request(
                 "POST",
                 f"/api/services/{domain}/{service}",
                 json=data,
             )
+            return error
 
+        results = []
+        # One failing call must not drop the outcome of the others
+        outcomes = await asyncio.gather(
+            *(_apply(update) for update in updates), return_exceptions=True
+        )
+        for update, error in zip(updates, outcomes):
+            entity_id = update["entity_id"]
+            if isinstance(error, Exception):
+                error = str(error) or type(error).__name__
             if error:
                 errors.append(f"Failed to update {entity_id}: {error}")
             else:
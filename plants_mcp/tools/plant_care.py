@@ -2,44 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import math
+from operator import itemgetter
 from typing import Any
 from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo
 
 from fastmcp import FastMCP
 
 from .common import (
-    PLANT_SUFFIXES,
+    LA_TZ,
     delay,
+    find_plant,
+    get_state,
     get_states_list,
     ha_request,
     history_window,
-    match_plant_name,
+    index_states_by_domain,
+    parse_manual_buttons,
     parse_plants_from_states,
-    sanitize_attributes,
+    parse_timestamp,
+    split_plant_suffix,
 )
 
+# Sort key for history entries without a parseable timestamp
+_MIN_DT = datetime.min.replace(tzinfo=LA_TZ)
+
 
 def register_plant_care_tools(mcp: FastMCP) -> None:
     """Register plant care tools."""
 
     def _strip_plant_name(friendly_name: str) -> str:
-        for suffix in PLANT_SUFFIXES.values():
-            if friendly_name.endswith(f" {suffix}"):
-                return suffix
-        return friendly_name
-
-    def _parse_timestamp(value: str) -> datetime | None:
-        if not value:
-            return None
-        try:
-            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-            if parsed.tzinfo is None:
-                return parsed.replace(tzinfo=ZoneInfo("America/Los_Angeles"))
-            return parsed
-        except ValueError:
-            return None
+        split = split_plant_suffix(friendly_name)
+        return split[2] if split else friendly_name
 
     def _normalize_history_payload(payload: Any) -> list[dict[str, Any]]:
         if not isinstance(payload, list):
@@ -57,42 +52,6 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             return []
         return [item for item in payload if isinstance(item, dict)]
 
-    def _manual_button_ids(
-        states: list[dict[str, Any]],
-    ) -> dict[str, str]:
-        mapping: dict[str, str] = {}
-        suffix = "Add Manual Watering"
-        for state in states:
-            entity_id = state.get("entity_id", "")
-            if not entity_id.startswith("button."):
-                continue
-            attributes = state.get("attributes") or {}
-            friendly = attributes.get("friendly_name", "")
-            if not friendly or not friendly.endswith(f" {suffix}"):
-                continue
-            plant_name = friendly[: -len(suffix) - 1].strip()
-            if plant_name:
-                mapping[plant_name] = entity_id
-        return mapping
-
-    def _manual_shower_button_ids(
-        states: list[dict[str, Any]],
-    ) -> dict[str, str]:
-        mapping: dict[str, str] = {}
-        suffix = "Add Manual Shower"
-        for state in states:
-            entity_id = state.get("entity_id", "")
-            if not entity_id.startswith("button."):
-                continue
-            attributes = state.get("attributes") or {}
-            friendly = attributes.get("friendly_name", "")
-            if not friendly or not friendly.endswith(f" {suffix}"):
-                continue
-            plant_name = friendly[: -len(suffix) - 1].strip()
-            if plant_name:
-                mapping[plant_name] = entity_id
-        return mapping
-
     def _build_auto_watering_events(
         entries: list[dict[str, Any]],
         kind: str,
@@ -101,7 +60,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         current_start: datetime | None = None
         for entry in entries:
             state = entry.get("state")
-            ts = _parse_timestamp(
+            ts = parse_timestamp(
                 entry.get("last_changed") or entry.get("last_updated") or ""
             )
             if not ts:
@@ -147,7 +106,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for entry in entries:
-            ts = _parse_timestamp(
+            ts = parse_timestamp(
                 entry.get("last_changed") or entry.get("last_updated") or ""
             )
             if not ts:
@@ -182,7 +141,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             state = entry.get("state")
             if not state or state == last_state:
                 continue
-            ts = _parse_timestamp(state)
+            ts = parse_timestamp(state)
             if not ts:
                 continue
             last_state = state
@@ -201,7 +160,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for entry in entries:
-            ts = _parse_timestamp(entry.get("when") or entry.get("timestamp") or "")
+            ts = parse_timestamp(entry.get("when") or entry.get("timestamp") or "")
             if not ts:
                 continue
             message = entry.get("message") or entry.get("state") or ""
@@ -221,7 +180,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for entry in entries:
-            ts = _parse_timestamp(
+            ts = parse_timestamp(
                 entry.get("last_changed") or entry.get("last_updated") or ""
             )
             if not ts:
@@ -254,7 +213,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             state = entry.get("state")
             if not state or state == last_state:
                 continue
-            ts = _parse_timestamp(state)
+            ts = parse_timestamp(state)
             if not ts:
                 continue
             last_state = state
@@ -273,7 +232,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         events: list[dict[str, Any]] = []
         for entry in entries:
-            ts = _parse_timestamp(entry.get("when") or entry.get("timestamp") or "")
+            ts = parse_timestamp(entry.get("when") or entry.get("timestamp") or "")
             if not ts:
                 continue
             message = entry.get("message") or entry.get("state") or ""
@@ -313,10 +272,10 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
     ) -> list[dict[str, Any]]:
         buckets: dict[str, dict[str, Any]] = {}
         for event in events:
-            start_ts = _parse_timestamp(event.get("start") or "")
+            start_ts = parse_timestamp(event.get("start") or "")
             if not start_ts:
                 continue
-            day = start_ts.astimezone(ZoneInfo("America/Los_Angeles")).date().isoformat()
+            day = start_ts.astimezone(LA_TZ).date().isoformat()
             bucket = buckets.setdefault(
                 day,
                 {
@@ -335,7 +294,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
                 if isinstance(amount_ml, (int, float)) and amount_ml > 0:
                     bucket["manual"]["total_liters"] += float(amount_ml) / 1000.0
 
-        days = sorted(buckets.values(), key=lambda item: item.get("date") or "", reverse=True)
+        days = sorted(buckets.values(), key=itemgetter("date"), reverse=True)
         for item in days:
             manual = item.get("manual")
             if isinstance(manual, dict) and isinstance(manual.get("total_liters"), float):
@@ -349,8 +308,9 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         if error:
             return {"status": "error", "error": error}
         raw_plants = parse_plants_from_states(states)
-        manual_watering_button_entities = _manual_button_ids(states)
-        manual_shower_button_entities = _manual_shower_button_ids(states)
+        manual_buttons = parse_manual_buttons(states)
+        manual_watering_button_entities = manual_buttons["manual_watering"]
+        manual_shower_button_entities = manual_buttons["manual_shower"]
         watering_entities: dict[str, dict[str, str | None]] = {}
         shower_entities: dict[str, dict[str, str | None]] = {}
         all_event_ids: list[str] = []
@@ -389,14 +349,31 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         logbook_by_entity: dict[str, list[dict[str, Any]]] = {}
         if all_event_ids:
             start_time, end_time = history_window(30)
-            _, history, error = await ha_request(
-                "GET",
-                f"/api/history/period/{start_time.isoformat()}",
-                params={
-                    "end_time": end_time.isoformat(),
-                    "filter_entity_id": ",".join(all_event_ids),
-                },
-            )
+            all_manual_ids = manual_watering_ids + manual_shower_ids
+            # History and logbook are independent; fetch them concurrently
+            requests = [
+                ha_request(
+                    "GET",
+                    f"/api/history/period/{start_time.isoformat()}",
+                    params={
+                        "end_time": end_time.isoformat(),
+                        "filter_entity_id": ",".join(all_event_ids),
+                    },
+                )
+            ]
+            if all_manual_ids:
+                requests.append(
+                    ha_request(
+                        "GET",
+                        f"/api/logbook/period/{start_time.isoformat()}",
+                        params={
+                            "end_time": end_time.isoformat(),
+                            "entity_id": ",".join(all_manual_ids),
+                        },
+                    )
+                )
+            responses = await asyncio.gather(*requests)
+            _, history, error = responses[0]
             if not error:
                 history_items = _normalize_history_payload(history)
                 for item in history_items:
@@ -405,23 +382,15 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
                         history_by_entity.setdefault(entity_id, []).append(item)
                 for entries in history_by_entity.values():
                     entries.sort(
-                        key=lambda entry: _parse_timestamp(
+                        key=lambda entry: parse_timestamp(
                             entry.get("last_changed")
                             or entry.get("last_updated")
                             or ""
                         )
-                        or datetime.min.replace(tzinfo=ZoneInfo("America/Los_Angeles"))
+                        or _MIN_DT
                     )
-            all_manual_ids = manual_watering_ids + manual_shower_ids
             if all_manual_ids:
-                _, logbook, log_error = await ha_request(
-                    "GET",
-                    f"/api/logbook/period/{start_time.isoformat()}",
-                    params={
-                        "end_time": end_time.isoformat(),
-                        "entity_id": ",".join(all_manual_ids),
-                    },
-                )
+                _, logbook, log_error = responses[1]
                 if not log_error:
                     log_items = _normalize_logbook_payload(logbook)
                     for item in log_items:
@@ -459,7 +428,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
                 )
             normalized = {}
             for key, items in grouped.items():
-                items.sort(key=lambda item: item.get("name") or "")
+                items.sort(key=itemgetter("name"))
                 normalized[key] = {item["name"]: item["value"] for item in items}
             water_meta = watering_entities.get(plant_name, {})
             auto_id = water_meta.get("auto")
@@ -516,12 +485,11 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             events.sort(key=lambda item: item.get("start") or "", reverse=True)
             normalized["watering_history"] = _group_watering_events_by_day(events)
             plants.append({"name": plant_name, "fields": normalized})
-        plants.sort(key=lambda plant: plant.get("name", ""))
+        plants.sort(key=itemgetter("name"))
 
         # Collect time data
-        la_tz = ZoneInfo("America/Los_Angeles")
         time_data = {
-            "current": datetime.now(la_tz).isoformat(),
+            "current": datetime.now(LA_TZ).isoformat(),
             "sunrise": None,
             "sunset": None,
         }
@@ -538,44 +506,50 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             "sensor.openweathermap_precipitation_kind",
             "sensor.openweathermap_weather_code",
         }
-        for state in states:
-            entity_id = state.get("entity_id", "")
-            if not entity_id:
+        by_domain = index_states_by_domain(states)
+        for state in by_domain.get("sun", []):
+            if state["entity_id"] != "sun.sun":
                 continue
-            if (
-                entity_id.startswith("weather.")
-                or "openweathermap" in entity_id
-                or entity_id == "sun.sun"
-            ):
-                if entity_id in weather_blacklist:
-                    continue
-                attributes = state.get("attributes", {})
-                if entity_id == "sun.sun":
-                    # Extract sunrise/sunset to time section and convert to local time
-                    if "next_rising" in attributes:
-                        sunrise_utc = _parse_timestamp(attributes.get("next_rising"))
-                        if sunrise_utc:
-                            time_data["sunrise"] = sunrise_utc.astimezone(la_tz).isoformat()
-                    if "next_setting" in attributes:
-                        sunset_utc = _parse_timestamp(attributes.get("next_setting"))
-                        if sunset_utc:
-                            time_data["sunset"] = sunset_utc.astimezone(la_tz).isoformat()
-                    continue
-                unit = attributes.get("unit_of_measurement") or ""
-                value = state.get("state")
-                display = f"{value} {unit}".strip() if value is not None else ""
-                name = attributes.get("friendly_name", entity_id)
-                if name.startswith("OpenWeatherMap "):
-                    name = name.replace("OpenWeatherMap ", "", 1)
-                if name == "OpenWeatherMap":
-                    name = "Weather"
-                weather_entities.append(
-                    {
-                        "name": name,
-                        "value": display,
-                    }
-                )
-        weather_entities.sort(key=lambda item: item.get("entity_id") or "")
+            attributes = state.get("attributes", {})
+            # Extract sunrise/sunset to time section and convert to local time
+            if "next_rising" in attributes:
+                sunrise_utc = parse_timestamp(attributes.get("next_rising"))
+                if sunrise_utc:
+                    time_data["sunrise"] = sunrise_utc.astimezone(LA_TZ).isoformat()
+            if "next_setting" in attributes:
+                sunset_utc = parse_timestamp(attributes.get("next_setting"))
+                if sunset_utc:
+                    time_data["sunset"] = sunset_utc.astimezone(LA_TZ).isoformat()
+        # weather.* plus OpenWeatherMap entities from any domain, once each
+        candidates = {state["entity_id"]: state for state in by_domain.get("weather", [])}
+        for domain_states in by_domain.values():
+            for state in domain_states:
+                if "openweathermap" in state["entity_id"]:
+                    candidates.setdefault(state["entity_id"], state)
+        # Keep the /api/states order the entries had before grouping by domain
+        position = {id(state): index for index, state in enumerate(states)}
+        weather_states = sorted(
+            candidates.values(), key=lambda state: position[id(state)]
+        )
+        for state in weather_states:
+            entity_id = state["entity_id"]
+            if entity_id in weather_blacklist:
+                continue
+            attributes = state.get("attributes", {})
+            unit = attributes.get("unit_of_measurement") or ""
+            value = state.get("state")
+            display = f"{value} {unit}".strip() if value is not None else ""
+            name = attributes.get("friendly_name", entity_id)
+            if name.startswith("OpenWeatherMap "):
+                name = name.replace("OpenWeatherMap ", "", 1)
+            if name == "OpenWeatherMap":
+                name = "Weather"
+            weather_entities.append(
+                {
+                    "name": name,
+                    "value": display,
+                }
+            )
 
         return {
             "status": "success",
@@ -585,6 +559,27 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             "indoor_plants": plants,
         }
 
+    async def _find_plant_with_state(
+        identifier: str, key: str
+    ) -> tuple[str | None, str | None, dict[str, Any] | None, str | None]:
+        """Find a plant and the live state of its ``key`` entity.
+
+        Returns (plant name, entity id, state, error). The plant index may
+        still name an entity HA no longer knows, so a missing state is
+        retried once against fresh states.
+        """
+        for refresh in (False, True):
+            plant_name, plant, error = await find_plant(identifier, refresh)
+            if error or plant is None:
+                return plant_name, None, None, error
+            entity_id = plant.get(f"{key}_entity_id")
+            if not entity_id:
+                return plant_name, None, None, None
+            state, error = await get_state(entity_id)
+            if error or state is not None:
+                break
+        return plant_name, entity_id, state, error
+
     @mcp.tool
     async def plant_care___water(
         identifier: str,
@@ -593,15 +588,16 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         """Turn on the watering outlet for a plant for a set duration."""
         if duration_seconds <= 0:
             return {"status": "error", "error": "Duration must be positive"}
-        states, error = await get_states_list()
+        (
+            plant_name,
+            switch_entity_id,
+            switch_state,
+            error,
+        ) = await _find_plant_with_state(identifier, "water_power")
         if error:
             return {"status": "error", "error": error}
-        plants = parse_plants_from_states(states)
-        plant_name = match_plant_name(plants.keys(), identifier)
         if not plant_name:
             return {"status": "error", "error": "Plant not found"}
-        plant = plants[plant_name]
-        switch_entity_id = plant.get("water_power_entity_id")
         if not switch_entity_id:
             return {
                 "status": "error",
@@ -610,15 +606,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
                     "You can only water it manually."
                 ),
             }
-        outlet_state = next(
-            (
-                state
-                for state in states
-                if state.get("entity_id") == switch_entity_id
-            ),
-            None,
-        )
-        if not outlet_state or outlet_state.get("state") == "unavailable":
+        if switch_state is None or switch_state.get("state") == "unavailable":
             return {
                 "status": "error",
                 "error": (
@@ -633,12 +621,17 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         )
         if error:
             return {"status": "error", "error": error}
-        await delay(duration_seconds)
-        _, _, error = await ha_request(
-            "POST",
-            "/api/services/switch/turn_off",
-            json={"entity_id": switch_entity_id},
-        )
+        try:
+            await delay(duration_seconds)
+        finally:
+            # Turn the outlet off even when the call is cancelled mid-watering
+            _, _, error = await asyncio.shield(
+                ha_request(
+                    "POST",
+                    "/api/services/switch/turn_off",
+                    json={"entity_id": switch_entity_id},
+                )
+            )
         if error:
             return {"status": "error", "error": error}
         return {
@@ -662,11 +655,9 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         if not math.isfinite(liters) or liters <= 0:
             return {"status": "error", "error": "Liters must be a positive number"}
 
-        states, error = await get_states_list()
+        matched_name, _, error = await find_plant(plant_name)
         if error:
             return {"status": "error", "error": error}
-        plants = parse_plants_from_states(states)
-        matched_name = match_plant_name(plants.keys(), plant_name)
         if not matched_name:
             return {"status": "error", "error": "Plant not found"}
 
@@ -702,11 +693,9 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             duration_minutes: Duration in minutes (optional)
             notes: Additional notes about the shower (optional)
         """
-        states, error = await get_states_list()
+        matched_name, _, error = await find_plant(plant_name)
         if error:
             return {"status": "error", "error": error}
-        plants = parse_plants_from_states(states)
-        matched_name = match_plant_name(plants.keys(), plant_name)
         if not matched_name:
             return {"status": "error", "error": "Plant not found"}
 
@@ -739,16 +728,16 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         Args:
             plant_name: Plant name
         """
-        states, error = await get_states_list()
+        (
+            matched_name,
+            light_entity_id,
+            light_state,
+            error,
+        ) = await _find_plant_with_state(plant_name, "light_power")
         if error:
             return {"status": "error", "error": error}
-        plants = parse_plants_from_states(states)
-        matched_name = match_plant_name(plants.keys(), plant_name)
         if not matched_name:
             return {"status": "error", "error": "Plant not found"}
-
-        plant = plants[matched_name]
-        light_entity_id = plant.get("light_power_entity_id")
         if not light_entity_id:
             return {
                 "status": "error",
@@ -756,15 +745,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             }
 
         # Check if the light entity is available
-        outlet_state = next(
-            (
-                state
-                for state in states
-                if state.get("entity_id") == light_entity_id
-            ),
-            None,
-        )
-        if not outlet_state or outlet_state.get("state") == "unavailable":
+        if light_state is None or light_state.get("state") == "unavailable":
             return {
                 "status": "error",
                 "error": f"The grow light for {matched_name} is unavailable",
@@ -792,16 +773,16 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
         Args:
             plant_name: Plant name
         """
-        states, error = await get_states_list()
+        (
+            matched_name,
+            light_entity_id,
+            light_state,
+            error,
+        ) = await _find_plant_with_state(plant_name, "light_power")
         if error:
             return {"status": "error", "error": error}
-        plants = parse_plants_from_states(states)
-        matched_name = match_plant_name(plants.keys(), plant_name)
         if not matched_name:
             return {"status": "error", "error": "Plant not found"}
-
-        plant = plants[matched_name]
-        light_entity_id = plant.get("light_power_entity_id")
         if not light_entity_id:
             return {
                 "status": "error",
@@ -809,15 +790,7 @@ def register_plant_care_tools(mcp: FastMCP) -> None:
             }
 
         # Check if the light entity is available
-        outlet_state = next(
-            (
-                state
-                for state in states
-                if state.get("entity_id") == light_entity_id
-            ),
-            None,
-        )
-        if not outlet_state or outlet_state.get("state") == "unavailable":
+        if light_state is None or light_state.get("state") == "unavailable":
             return {
                 "status": "error",
                 "error": f"The grow light for {matched_name} is unavailable",